@@ -1,18 +1,31 @@
 from __future__ import annotations
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Literal, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+import hashlib
+import json
+import math
+import os
 
 from omega_fusion_core.core.model import OmegaPacket, Domain, StateKind, RoleKind, Channel
 from omega_fusion_core.core.universal_moment import UniversalMomentCalculator
 from omega_fusion_core.core.tic import TICCalculator
-from omega_fusion_core.storage.sequence_store import SequenceStore
+from omega_fusion_core.core.event_log import EventLog
+from omega_fusion_core.core.broadcast import Broadcaster
+from omega_fusion_core.core.ingest import IngestPipeline, packet_from_event
+from omega_fusion_core.storage.shared_store import get_shared_store
 from omega_fusion_core.pattern_hub.macro_playback import MacroPlayer
+from omega_fusion_core.pattern_hub.jobs import PatternJobScheduler
 from omega_fusion_core.host.muscles import HostMuscles
 from omega_fusion_core.host.executor import MacroExecutor
+from omega_144d_core.regimes import REGIME_LABELS
+from omega_144d_core.sessions import SessionStore, advance_session, encode_columns
+from api import instrument
 
 
 app = FastAPI(title="Omega OS Desktop UI (TIC + Electron)")
@@ -25,12 +38,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.mount("/", StaticFiles(directory="../ui", html=True), name="ui")
+UI_DIR = Path("../ui")
 
 _calc = UniversalMomentCalculator()
 _tic_calc = TICCalculator()
+_store = get_shared_store()  # shared across requests; reloads when the file changes
 
-EVENT_LOG: List[Dict[str, Any]] = []  # rolling window of latest events
+EVENT_LOG = EventLog(capacity=200)  # rolling window of latest events, with seq numbers
+
+# Live feed for /api/events/stream: items are (seq, pre-encoded SSE frame).
+_stream = Broadcaster(max_queue=512, policy="drop_oldest")
+STREAM_HEARTBEAT_SEC = 15.0
+
+# Materialized status: (dict, JSON body, ETag), rebuilt by the ingest thread
+# after each batch and swapped in as one tuple, so reads never recompute.
+_status: Tuple[Dict[str, Any], bytes, str] = ({}, b"", "")
 
 
 class PatternInfo(BaseModel):
@@ -47,13 +69,15 @@ class RunPatternRequest(BaseModel):
     id: str
     speed: float = 1.0
     loop_repeats: int = 0
+    timing: Literal["relative", "deadline"] = "relative"
 
 
-@app.get("/api/status")
-def get_status():
-    snap = _calc.compute_from_packets([])
+def _refresh_status() -> bool:
+    """Rebuild the cached status from the running moment window; True if the scores changed."""
+    global _status
+    snap = _calc.snapshot()
     tic = _tic_calc.from_moment(snap)
-    return {
+    status = {
         "timestamp": snap.timestamp.isoformat(),
         "uai": snap.uai,
         "life_coherence": snap.life_coherence,
@@ -63,66 +87,376 @@ def get_status():
         "courage": tic.courage,
         "omega_effective": tic.omega_effective,
     }
+    body = json.dumps(status).encode()
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    previous = _status[0]
+    changed = any(previous.get(k) != v for k, v in status.items() if k != "timestamp")
+    _status = (status, body, etag)
+    return changed
+
+
+_refresh_status()
+
+
+@app.get("/api/status")
+def get_status(request: Request):
+    """Current UAI/TIC scores; honours If-None-Match with 304 Not Modified."""
+    status, body, etag = _status
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _pattern_info(seq: Dict[str, Any]) -> PatternInfo:
+    steps = seq.get("steps") or []
+    return PatternInfo(
+        seq_id=seq["id"],
+        label=seq.get("label") or seq.get("name") or seq["id"],
+        date=str(seq.get("date", "")),
+        tags=seq.get("tags") or [],
+        duration_sec=float(seq.get("duration_sec", sum(float(s.get("delay", 0)) for s in steps))),
+        uai_before=float(seq.get("uai_before", 0.0)),
+        uai_after=float(seq.get("uai_after", 0.0)),
+    )
 
 
 @app.get("/api/patterns", response_model=List[PatternInfo])
 def list_patterns():
-    store = SequenceStore()
-    ids = store.list_ids()
     out: List[PatternInfo] = []
-    for seq_id in ids:
-        seq = store.get_sequence(seq_id)
+    for seq_id in _store.list_ids():
+        seq = _store.get_sequence(seq_id)
         if not seq:
             continue
-        out.append(
-            PatternInfo(
-                seq_id=seq.seq_id,
-                label=seq.label,
-                date=seq.date,
-                tags=seq.context_tags,
-                duration_sec=seq.duration_sec,
-                uai_before=seq.uai_before,
-                uai_after=seq.uai_after,
-            )
-        )
+        out.append(_pattern_info(seq))
     return out
 
 
+@app.get("/api/patterns/cache")
+def get_pattern_cache_metrics():
+    """Hit/reload/parse-time counters of the shared pattern store."""
+    return _store.metrics()
+
+
 @app.get("/api/events")
-def get_events():
-    """Return the latest Omega events with TIC annotations."""
-    # return last 50 for UI
-    return EVENT_LOG[-50:]
+def get_events(
+    since: Optional[int] = Query(None, ge=0, description="Only return events with seq > since"),
+    limit: int = Query(50, ge=1, le=EVENT_LOG.capacity),
+):
+    """
+    Return Omega events with TIC annotations, oldest first. Without ``since``
+    this is the latest ``limit`` events; pollers pass the last ``seq`` they saw.
+    """
+    return EVENT_LOG.read(since=since, limit=limit)
+
+
+def fusion_log_batch(items: List[Any]) -> None:
+    """Annotate a batch of packets / PATTERN_STEP events with TIC and append them to EVENT_LOG."""
+    packets = [packet_from_event(item) for item in items]
+    snaps = _calc.compute_each(packets)
+    for packet in packets:
+        _calc.push(packet)
+    tics = _tic_calc.from_moments(snaps)
+    events = []
+    for packet, snap, tic in zip(packets, snaps, tics):
+        events.append({
+            "timestamp": snap.timestamp.isoformat(),
+            "domain": packet.domain.name,
+            "state": packet.state.name,
+            "role": packet.role.name,
+            "tags": packet.tags,
+            "truth": tic.truth,
+            "integrity": tic.integrity,
+            "courage": tic.courage,
+            "omega_effective": tic.omega_effective,
+        })
+    EVENT_LOG.extend(events)
+    if _stream.subscriber_count:
+        for event in events:
+            _stream.publish((event["seq"], _sse_frame("fusion", event, event["seq"])))
+    if _refresh_status() and _stream.subscriber_count:
+        _stream.publish((None, _status_frame()))
 
 
 def fusion_log(packet: OmegaPacket) -> None:
-    snap = _calc.compute_from_packets([packet])
-    tic = _tic_calc.from_moment(snap)
-    event = {
-        "timestamp": snap.timestamp.isoformat(),
-        "domain": packet.domain.name,
-        "state": packet.state.name,
-        "role": packet.role.name,
-        "tags": packet.tags,
-        "truth": tic.truth,
-        "integrity": tic.integrity,
-        "courage": tic.courage,
-        "omega_effective": tic.omega_effective,
-    }
-    EVENT_LOG.append(event)
-    if len(EVENT_LOG) > 200:
-        del EVENT_LOG[0]
+    fusion_log_batch([packet])
+
+
+def _sse_frame(kind: str, data: Any, seq: Optional[int] = None) -> str:
+    head = f"id: {seq}\n" if seq is not None else ""
+    return f"{head}event: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _status_frame() -> str:
+    return f"event: status\ndata: {_status[1].decode()}\n\n"
+
+
+@app.get("/api/events/stream")
+async def stream_events(request: Request, since: Optional[int] = Query(None, ge=0)):
+    """
+    Server-Sent Events feed: a ``status`` frame on connect and whenever the
+    scores change, and a ``fusion`` frame (``id`` = seq) per new event.
+    ``since`` (or the ``Last-Event-ID`` header on reconnect) replays retained
+    events first. A client that falls behind loses its oldest queued frames
+    and is sent a ``dropped`` frame with the count; it can backfill through
+    ``GET /api/events?since=``.
+    """
+    last_event_id = request.headers.get("last-event-id", "")
+    if since is None and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def frames():
+        # Subscribed only once the body starts streaming, so a client that
+        # goes away before that never leaves a queue behind.
+        sub = _stream.subscribe()
+        try:
+            # Read right after subscribing: anything newer is already queued.
+            # A ``since`` past the log (ids from before a server restart) is
+            # clamped, or every new event would look already sent.
+            sent = EVENT_LOG.last_seq
+            replay = None
+            if since is not None:
+                replay = EVENT_LOG.read(since=since, limit=EVENT_LOG.capacity)
+                sent = replay[-1]["seq"] if replay else min(since, sent)
+            yield _status_frame()
+            if replay:
+                yield "".join(_sse_frame("fusion", event, event["seq"]) for event in replay)
+            while True:
+                batch = await sub.get_batch(timeout=STREAM_HEARTBEAT_SEC)
+                if not batch:
+                    yield ": keepalive\n\n"
+                    continue
+                out = []
+                dropped = sub.take_dropped()
+                if dropped:
+                    out.append(_sse_frame("dropped", {"count": dropped}))
+                for seq, frame in batch:
+                    if seq is None or seq > sent:
+                        out.append(frame)
+                        sent = seq or sent
+                yield "".join(out)
+        except StopAsyncIteration:  # disconnected by the broadcaster
+            pass
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
+@app.get("/api/events/stream/metrics")
+async def get_stream_metrics():
+    """Subscriber count and publish/drop counters of the event stream."""
+    return _stream.metrics()
 
-@app.post("/api/run-pattern")
-def run_pattern(req: RunPatternRequest):
-    store = SequenceStore()
-    seq = store.get_sequence(req.id)
+
+# Pattern steps are ingested off the playback path, in micro-batches.
+_ingest = IngestPipeline(fusion_log_batch, max_queue=10_000, batch_size=256, policy="drop_oldest")
+
+
+@app.get("/api/ingest/metrics")
+def get_ingest_metrics():
+    """Queue depth, drop and latency counters of the fusion ingest pipeline."""
+    return _ingest.metrics()
+
+
+# One player for the process: it is stateless apart from its compiled-plan cache.
+_player = MacroPlayer(fusion_ingest_fn=_ingest.submit, executor=MacroExecutor(muscles=HostMuscles()))
+
+
+# Job state is owned by the event loop, so the job endpoints are all async.
+_jobs = PatternJobScheduler(player_factory=lambda: _player, max_concurrency=16)
+
+
+@app.post("/api/run-pattern", status_code=202)
+async def run_pattern(req: RunPatternRequest):
+    """Start a pattern run in the background and return its job id immediately."""
+    seq = _store.get_sequence(req.id)
     if not seq:
         raise HTTPException(status_code=404, detail=f"No sequence with id '{req.id}'")
 
-    muscles = HostMuscles()
-    executor = MacroExecutor(muscles=muscles)
-    player = MacroPlayer(fusion_ingest_fn=fusion_log, executor=executor)
-    player.play(seq, speed=req.speed, loop_repeats=req.loop_repeats)
-    return {"status": "ok", "message": f"Pattern '{req.id}' executed."}
+    job = _jobs.submit(seq, speed=req.speed, loop_repeats=req.loop_repeats, timing=req.timing)
+    return {"status": "accepted", "job_id": job.id, "message": f"Pattern '{req.id}' scheduled."}
+
+
+@app.get("/api/jobs")
+async def list_jobs():
+    return [job.to_dict() for job in _jobs.list_jobs()]
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job with id '{job_id}'")
+    return job.to_dict()
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job with id '{job_id}'")
+    return {"cancelled": _jobs.cancel(job_id), "job": job.to_dict()}
+
+
+# Server-held 144D engines, bounded by count (LRU) and idle time (TTL).
+_sessions = SessionStore(max_sessions=64, ttl=900.0)
+
+
+class CreateSessionRequest(BaseModel):
+    n_domains: int = Field(12, ge=1, le=128)
+    domain_size: int = Field(12, ge=1, le=128)
+    backend: Literal["python", "numpy", "sparse"] = "python"
+    coupling: float = 0.18
+    damping: float = 0.04
+    initial_vector: Optional[List[float]] = None
+
+
+class AdvanceRequest(BaseModel):
+    steps: int = Field(1, ge=1, le=100_000)
+    inputs: Optional[List[Optional[List[float]]]] = None  # inputs[i] feeds step i
+    fast_forward: bool = False
+    stride: int = Field(1, ge=1)  # sample coherence after every stride-th step
+    include_state: bool = False
+    format: Literal["json", "binary"] = "json"
+
+
+def _get_session(session_id: str):
+    session = _sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"No session with id '{session_id}' (expired or evicted?)")
+    return session
+
+
+@app.post("/api/omega144/sessions", status_code=201)
+def create_session(req: CreateSessionRequest):
+    try:
+        session = _sessions.create(
+            initial_vector=req.initial_vector,
+            n_domains=req.n_domains,
+            domain_size=req.domain_size,
+            backend=req.backend,
+            coupling=req.coupling,
+            damping=req.damping,
+        )
+    except ImportError as exc:  # numpy backend without numpy installed
+        raise HTTPException(status_code=400, detail=str(exc))
+    return session.info()
+
+
+@app.get("/api/omega144/sessions")
+def list_sessions():
+    return [session.info() for session in _sessions.list_sessions()]
+
+
+@app.get("/api/omega144/sessions/{session_id}")
+def get_session(session_id: str):
+    return _get_session(session_id).info()
+
+
+def _json_floats(values) -> List[Optional[float]]:
+    """``values`` as a JSON-safe list: NaN/inf (a diverged engine) become null."""
+    return [x if math.isfinite(x) else None for x in values]
+
+
+@app.post("/api/omega144/sessions/{session_id}/advance")
+def advance(session_id: str, req: AdvanceRequest):
+    """
+    Advance a session by ``steps``. JSON output is columnar (``coherence``
+    and ``regime`` code arrays sampled every ``stride`` steps from ``t0``,
+    codes index ``regime_labels``; non-finite values are null); ``binary``
+    returns the frame documented in ``omega_144d_core.sessions``.
+    """
+    session = _get_session(session_id)
+    try:
+        cols = advance_session(
+            session,
+            req.steps,
+            inputs=req.inputs,
+            fast_forward=req.fast_forward,
+            include_state=req.include_state,
+            stride=req.stride,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except OverflowError:  # fast_forward jump too far for the mode growth factors
+        raise HTTPException(status_code=422, detail=f"Engine diverges within {req.steps} steps (float overflow)")
+    finally:
+        _sessions.touch(session)
+    if req.format == "binary":
+        return Response(
+            content=encode_columns(cols), media_type="application/octet-stream", headers={"X-Omega-T": str(cols["t"])}
+        )
+    out = {
+        "session_id": session_id,
+        "t0": cols["t0"],
+        "t": cols["t"],
+        "stride": cols["stride"],
+        "coherence": _json_floats(cols["coherence"]),
+        "regime": cols["regime"].tolist(),
+        "regime_labels": REGIME_LABELS,
+    }
+    if req.include_state:
+        out["state"] = _json_floats(cols["state"])
+    return out
+
+
+@app.delete("/api/omega144/sessions/{session_id}")
+def delete_session(session_id: str):
+    if not _sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail=f"No session with id '{session_id}'")
+    return {"deleted": session_id}
+
+
+# Stage latency instrumentation is off (and free) unless OMEGA_INSTRUMENT is set:
+# "1"/"all" for every stage or a comma list, e.g. "dss,ingest". OMEGA_PROFILE_TRIGGER
+# ("stage:seconds[,...]") profiles calls that follow a slower-than-threshold one.
+_instrument_env = os.environ.get("OMEGA_INSTRUMENT", "").strip()
+if _instrument_env and _instrument_env != "0":
+    instrument.enable(None if _instrument_env in ("1", "all") else _instrument_env.split(","))
+for _trigger in filter(None, os.environ.get("OMEGA_PROFILE_TRIGGER", "").split(",")):
+    _stage, _, _threshold = _trigger.partition(":")
+    instrument.trigger_profile(_stage.strip(), float(_threshold))
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text exposition: stage latency histograms plus component counters and gauges."""
+    ingest = _ingest.metrics()
+    stream = _stream.metrics()
+    store = _store.metrics()
+    counters = {
+        **{f"ingest_{k}": ingest[k] for k in ("submitted", "accepted", "dropped", "sampled_out", "processed", "batches", "errors")},
+        **{f"stream_{k}": stream[k] for k in ("published", "dropped", "disconnected")},
+        **{f"store_{k}": store[k] for k in ("hits", "misses", "reloads", "parse_errors")},
+        "plan_cache_hits": _player.plans.hits,
+        "plan_cache_misses": _player.plans.misses,
+        "sessions_evicted": _sessions.evicted,
+        "sessions_expired": _sessions.expired,
+    }
+    gauges = {
+        "ingest_queue_depth": ingest["queue_depth"],
+        "stream_subscribers": stream["subscribers"],
+        "event_log_last_seq": EVENT_LOG.last_seq,
+        "sessions": len(_sessions),
+        "jobs_active": _jobs.active_count(),
+        "status_omega_effective": _status[0]["omega_effective"],
+    }
+    return PlainTextResponse(
+        instrument.render_prometheus(counters, gauges), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/api/metrics/profiles")
+def get_metric_profiles():
+    """cProfile summaries captured by OMEGA_PROFILE_TRIGGER."""
+    return instrument.profiles()
+
+
+# Mounted last so the catch-all static route does not shadow the API routes.
+if UI_DIR.is_dir():
+    app.mount("/", StaticFiles(directory=str(UI_DIR), html=True), name="ui")
@@ -0,0 +1 @@
+# CanonForge Omega benchmarks (run as modules, e.g. python -m benchmarks.step_allocations)
@@ -0,0 +1,71 @@
+"""
+Per-step allocation and throughput of Omega144Core.step by detail level.
+
+Usage:
+    python -m benchmarks.step_allocations [--steps N] [--backend python|numpy]
+
+For every ``detail`` mode it reports:
+- peak_bytes: transient memory allocated inside one step (tracemalloc peak)
+- kept_bytes: memory still referenced by the returned result
+- steps_per_sec: throughput with tracing disabled
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from omega_144d_core import Omega144Core
+from omega_144d_core.rc144_core import STEP_DETAILS
+
+
+def _fresh_core(backend: str) -> Omega144Core:
+    core = Omega144Core(backend=backend)
+    core.initialize([1, 0, 1, 1])
+    for _ in range(core.event_queue.max_events):  # start with a full event queue
+        core.step(detail="minimal")
+    return core
+
+
+def measure(detail: str, steps: int, backend: str) -> dict:
+    core = _fresh_core(backend)
+    peaks = 0
+    kept = 0
+    tracemalloc.start()
+    for _ in range(steps):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        out = core.step(detail=detail)
+        current, peak = tracemalloc.get_traced_memory()
+        peaks += peak - before
+        kept += current - before
+        del out
+    tracemalloc.stop()
+
+    core = _fresh_core(backend)
+    start = time.perf_counter()
+    for _ in range(steps):
+        core.step(detail=detail)
+    elapsed = time.perf_counter() - start
+    return {
+        "detail": detail,
+        "peak_bytes": peaks // steps,
+        "kept_bytes": kept // steps,
+        "steps_per_sec": steps / elapsed if elapsed else float("inf"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--backend", default="python")
+    args = parser.parse_args()
+    print(f"{'detail':<10}{'peak B/step':>14}{'kept B/step':>14}{'steps/s':>12}")
+    for detail in STEP_DETAILS:
+        r = measure(detail, args.steps, args.backend)
+        print(f"{r['detail']:<10}{r['peak_bytes']:>14}{r['kept_bytes']:>14}{r['steps_per_sec']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Throughput benchmarks for the 144D core, pattern store/playback and API.
+
+Usage:
+    python -m benchmarks.suite [--out results.json] [--baseline baseline.json]
+                               [--threshold 0.10] [--only NAME ...] [--quick]
+                               [--backend python|numpy] [--min-time SEC]
+
+Every benchmark reports ``ops_per_sec`` (higher is better) under a stable
+name such as ``core_step[64x64]``. ``--out`` writes the run as JSON; with
+``--baseline`` each result is compared to the stored run and the exit code
+is 1 if any benchmark got slower by more than ``--threshold`` (a fraction).
+
+Benchmarks:
+- core_step[NxN]: Omega144Core.step(detail="full") across grid sizes
+- dss_compute[NxN]: DSSEngine.compute alone
+- event_queue_tick: EventQueue.tick with the ring at capacity
+- sequence_store_load[N] / sequence_store_lookup[N]: SequenceStore over a
+  synthetic N-pattern JSON file (load reports patterns parsed per second)
+- macro_play[relative|deadline]: MacroPlayer.play steps/sec, zero delays,
+  no-op host actions and ingest
+- api_events / api_status: GET requests/sec through the ASGI test client
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from omega_144d_core import Omega144Core
+from omega_144d_core.dss_engine import make_dss_engine
+from omega_144d_core.event_queue import EventQueue
+
+GRID_SIZES = (12, 32, 64, 128)
+QUICK_GRID_SIZES = (12, 32)
+STORE_SIZES = (10_000, 100_000)
+QUICK_STORE_SIZES = (10_000,)
+
+# Steps per timed batch: the DSS global mean grows every step, so engines are
+# re-initialized between batches to stay clear of float overflow.
+CORE_BATCH = 200
+
+Result = Dict[str, Any]
+
+
+def _throughput(setup: Callable[[], Any], run: Callable[[Any], int], min_time: float, repeat: int = 3) -> float:
+    """
+    Best-of-``repeat`` ops/sec. Each repeat calls ``run(setup())`` (only
+    ``run`` is timed; it returns the number of ops it did) until at least
+    ``min_time`` seconds of timed work have accumulated.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        ops = 0
+        elapsed = 0.0
+        while elapsed < min_time:
+            ctx = setup()
+            start = time.perf_counter()
+            ops += run(ctx)
+            elapsed += time.perf_counter() - start
+        best = max(best, ops / elapsed)
+    return best
+
+
+def bench_core_step(size: int, backend: str, min_time: float) -> Result:
+    rng = random.Random(size)
+    initial = [rng.random() for _ in range(size * size)]
+    core = Omega144Core(n_domains=size, domain_size=size, backend=backend, track_stats=False)
+
+    def setup() -> Omega144Core:
+        core.initialize(initial)
+        return core
+
+    def run(c: Omega144Core) -> int:
+        step = c.step
+        for _ in range(CORE_BATCH):
+            step()
+        return CORE_BATCH
+
+    return {"ops_per_sec": _throughput(setup, run, min_time), "unit": "steps/s", "backend": backend}
+
+
+def bench_dss_compute(size: int, backend: str, min_time: float) -> Result:
+    engine = make_dss_engine(backend, n_domains=size, domain_size=size)
+    rng = random.Random(size)
+    state = engine.to_state([rng.random() for _ in range(size * size)])
+
+    def run(s: Any) -> int:
+        compute = engine.compute
+        for _ in range(CORE_BATCH):
+            compute(s)
+        return CORE_BATCH
+
+    # Copied per batch: the sparse backend updates its state in place.
+    return {
+        "ops_per_sec": _throughput(lambda: engine.copy_state(state), run, min_time),
+        "unit": "computes/s",
+        "backend": backend,
+    }
+
+
+def bench_event_queue_tick(min_time: float) -> Result:
+    queue = EventQueue()
+    state = [0.0] * 144
+    metrics = {"coherence": 0.9, "max_abs": 1.0, "variance": 0.01}
+    for t in range(queue.max_events):
+        queue.tick(t, state, metrics)
+    n = 10_000
+
+    def run(q: EventQueue) -> int:
+        tick = q.tick
+        for t in range(n):
+            tick(t, state, metrics)
+        return n
+
+    return {"ops_per_sec": _throughput(lambda: queue, run, min_time), "unit": "ticks/s", "capacity": queue.max_events}
+
+
+def _write_patterns(path: Path, n: int) -> List[str]:
+    rng = random.Random(n)
+    kinds = ("OPEN_APP", "FOCUS", "TYPE", "CLICK", "LOG")
+    patterns = [
+        {
+            "id": f"S_{i:06d}",
+            "name": f"Synthetic pattern {i}",
+            "tags": rng.sample(["focus", "ecfr", "report", "morning", "evening", "deep"], 2),
+            "steps": [
+                {"kind": rng.choice(kinds), "delay": 0.0, "payload": {"name": f"app{j}", "text": "x" * 16}}
+                for j in range(5)
+            ],
+        }
+        for i in range(n)
+    ]
+    path.write_text(json.dumps({"patterns": patterns}), encoding="utf-8")
+    return [p["id"] for p in patterns]
+
+
+def bench_sequence_store(n: int, min_time: float) -> Iterator[Tuple[str, Result]]:
+    from omega_fusion_core.storage.sequence_store import SequenceStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sequences.json"
+        ids = _write_patterns(path, n)
+        size = path.stat().st_size
+
+        def load(store: SequenceStore) -> int:
+            store.list_ids()
+            return n
+
+        yield f"sequence_store_load[{n}]", {
+            "ops_per_sec": _throughput(lambda: SequenceStore(path), load, min_time, repeat=2),
+            "unit": "patterns/s",
+            "file_bytes": size,
+        }
+
+        store = SequenceStore(path)
+        store.list_ids()
+        rng = random.Random(0)
+        keys = [rng.choice(ids) for _ in range(10_000)]
+
+        def lookup(s: SequenceStore) -> int:
+            get = s.get_sequence
+            for key in keys:
+                get(key)
+            return len(keys)
+
+        yield f"sequence_store_lookup[{n}]", {
+            "ops_per_sec": _throughput(lambda: store, lookup, min_time),
+            "unit": "lookups/s",
+        }
+
+
+def bench_macro_play(timing: str, min_time: float) -> Result:
+    from omega_fusion_core.host.executor import MacroExecutor
+    from omega_fusion_core.host.muscles import HostMuscles
+    from omega_fusion_core.pattern_hub.macro_playback import MacroPlayer
+
+    class _NullMuscles(HostMuscles):
+        def open_app(self, name: str):
+            pass
+
+        def focus_window(self, title: str):
+            pass
+
+        def type_text(self, text: str):
+            pass
+
+        def click(self, target: str):
+            pass
+
+        def custom_action(self, action: Dict[str, Any]):
+            pass
+
+    kinds = ("OPEN_APP", "FOCUS", "TYPE", "CLICK", "LOG")
+    sequence = {
+        "id": "S_BENCH",
+        "name": "Zero-delay benchmark",
+        "tags": ["bench"],
+        "steps": [{"kind": kinds[i % len(kinds)], "delay": 0.0, "payload": {"name": "app"}} for i in range(100)],
+    }
+    player = MacroPlayer(fusion_ingest_fn=lambda event: None, executor=MacroExecutor(muscles=_NullMuscles()))
+    loops = 10
+
+    def run(p: MacroPlayer) -> int:
+        p.play(sequence, loop_repeats=loops, timing=timing, spin=0.0)
+        return loops * len(sequence["steps"])
+
+    return {"ops_per_sec": _throughput(lambda: player, run, min_time), "unit": "steps/s"}
+
+
+def bench_api(min_time: float) -> Iterator[Tuple[str, Result]]:
+    from fastapi.testclient import TestClient
+
+    from api import app as api_app
+
+    api_app.fusion_log_batch([{"tags": ["bench"], "timestamp": time.time()} for _ in range(api_app.EVENT_LOG.capacity)])
+    n = 200
+    with TestClient(api_app.app) as client:
+        for name, url in (("api_events", "/api/events"), ("api_status", "/api/status")):
+
+            def run(c: TestClient, url: str = url) -> int:
+                for _ in range(n):
+                    c.get(url).raise_for_status()
+                return n
+
+            yield name, {"ops_per_sec": _throughput(lambda: client, run, min_time), "unit": "requests/s"}
+
+
+def run_suite(backend: str = "python", quick: bool = False, min_time: float = 0.5, only: Optional[List[str]] = None) -> Dict[str, Result]:
+    """Run every benchmark whose name contains one of ``only`` (all if empty)."""
+
+    def wanted(name: str) -> bool:
+        return not only or any(pattern in name for pattern in only)
+
+    # (result names, job); a job returns one result or yields (name, result) pairs.
+    jobs: List[Tuple[List[str], Callable[[], Any]]] = []
+    for size in QUICK_GRID_SIZES if quick else GRID_SIZES:
+        grid = f"{size}x{size}"
+        jobs.append(([f"core_step[{grid}]"], lambda size=size: bench_core_step(size, backend, min_time)))
+        jobs.append(([f"dss_compute[{grid}]"], lambda size=size: bench_dss_compute(size, backend, min_time)))
+    jobs.append((["event_queue_tick"], lambda: bench_event_queue_tick(min_time)))
+    for n in QUICK_STORE_SIZES if quick else STORE_SIZES:
+        names = [f"sequence_store_load[{n}]", f"sequence_store_lookup[{n}]"]
+        jobs.append((names, lambda n=n: bench_sequence_store(n, min_time)))
+    for timing in ("relative", "deadline"):
+        jobs.append(([f"macro_play[{timing}]"], lambda timing=timing: bench_macro_play(timing, min_time)))
+    jobs.append((["api_events", "api_status"], lambda: bench_api(min_time)))
+
+    results: Dict[str, Result] = {}
+    for names, job in jobs:
+        if not any(wanted(name) for name in names):
+            continue
+        out = job()
+        for name, result in [(names[0], out)] if isinstance(out, dict) else out:
+            if wanted(name):
+                results[name] = result
+                print(f"{name:<34}{result['ops_per_sec']:>16,.0f} {result['unit']}", file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, Result], baseline: Dict[str, Result], threshold: float) -> List[Dict[str, Any]]:
+    """Per-benchmark ratio against ``baseline``; ``regressed`` when it fell by more than ``threshold``."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("ops_per_sec"):
+            continue
+        ratio = result["ops_per_sec"] / base["ops_per_sec"]
+        rows.append({"name": name, "ratio": ratio, "regressed": ratio < 1.0 - threshold})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown fraction (default 0.10)")
+    parser.add_argument("--only", nargs="*", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--quick", action="store_true", help="small grids and pattern files only")
+    parser.add_argument("--backend", default="python", help="DSS backend for core/dss benchmarks (python, numpy, sparse)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="timed seconds per repeat")
+    args = parser.parse_args()
+
+    results = run_suite(backend=args.backend, quick=args.quick, min_time=args.min_time, only=args.only)
+    run = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "backend": args.backend,
+            "quick": args.quick,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+    regressed = False
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        rows = compare(results, baseline, args.threshold)
+        run["comparison"] = {"baseline": str(args.baseline), "threshold": args.threshold, "rows": rows}
+        for row in rows:
+            flag = "REGRESSED" if row["regressed"] else ""
+            print(f"{row['name']:<34}{row['ratio']:>8.2f}x  {flag}", file=sys.stderr)
+        regressed = any(row["regressed"] for row in rows)
+
+    if args.out:
+        args.out.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    else:
+        json.dump(run, sys.stdout, indent=2)
+        print()
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,3 @@
 from .rc144_core import Omega144Core
+from .batch_core import Omega144Batch
+from .dss_engine import SparseInput
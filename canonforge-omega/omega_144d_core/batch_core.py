@@ -0,0 +1,117 @@
+"""
+CanonForge Omega · batched 144D engine
+
+Holds N independent universes as one ``(N, n_domains, domain_size)`` float64
+array and advances them together with ``NumpyDSSEngine.compute_many``. Each
+universe follows exactly the same rules as a standalone ``Omega144Core``
+(bus merge, DSS update, overlay, regime), but without per-universe Python
+objects. Requires numpy.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .dss_engine import NumpyDSSEngine, np
+from .regimes import REGIME_LABELS, classify_regimes
+
+
+class Omega144Batch:
+    def __init__(
+        self,
+        n_universes: int,
+        n_domains: int = 12,
+        domain_size: int = 12,
+        coupling: float = 0.18,
+        damping: float = 0.04,
+    ):
+        self.dss = NumpyDSSEngine(
+            n_domains=n_domains, domain_size=domain_size, coupling=coupling, damping=damping
+        )
+        self.n_universes = int(n_universes)
+        self.n_domains = n_domains
+        self.domain_size = domain_size
+        self.dim = n_domains * domain_size
+
+        self.states = np.zeros((self.n_universes, n_domains, domain_size), dtype=np.float64)
+        self.t: int = 0
+
+    def _to_batch(self, vectors) -> Any:
+        """Coerce an ``(N, k)`` batch to ``(N, dim)``, zero-padding or truncating like ``Omega144Core``."""
+        arr = np.asarray(vectors, dtype=np.float64)
+        if arr.ndim == 1:
+            arr = np.broadcast_to(arr, (self.n_universes, arr.shape[0]))
+        if arr.ndim != 2 or arr.shape[0] != self.n_universes:
+            raise ValueError(f"Expected a batch of {self.n_universes} vectors, got shape {arr.shape}")
+        width = arr.shape[1]
+        if width == self.dim:
+            return arr
+        out = np.zeros((self.n_universes, self.dim), dtype=np.float64)
+        n = min(width, self.dim)
+        out[:, :n] = arr[:, :n]
+        return out
+
+    def initialize(self, initial_vectors=None) -> None:
+        if initial_vectors is None:
+            self.states.fill(0.0)
+        else:
+            self.states = self._to_batch(initial_vectors).reshape(
+                self.n_universes, self.n_domains, self.domain_size
+            ).copy()
+        self.t = 0
+
+    def classify_regimes(self, coherence) -> Any:
+        """Map a coherence array to regime codes (indices into ``REGIME_LABELS``)."""
+        return classify_regimes(np.asarray(coherence))
+
+    def step_many(self, input_batch=None) -> Dict[str, Any]:
+        """
+        Advance every universe by one step.
+
+        ``input_batch`` is an optional ``(N, dim)`` array of external inputs
+        (narrower batches are zero-padded, a single vector is broadcast). The
+        result holds per-universe arrays; ``regime`` is an int8 code array,
+        see ``REGIME_LABELS``.
+        """
+        merged = self.states
+        if input_batch is not None:
+            ext = self._to_batch(input_batch).reshape(self.states.shape)
+            merged = (self.states + ext) / 2.0
+        new_states, metrics = self.dss.compute_many(merged)
+        self.states = new_states
+        self.t += 1
+
+        coherence = metrics["coherence"]
+        domains, axes = self.dss.output_means(metrics)
+        return {
+            "t": self.t,
+            "coherence": coherence,
+            "regime": self.classify_regimes(coherence),
+            "metrics": metrics,
+            "overlay": {
+                "domains": domains,
+                "axes": axes,
+                "global": {
+                    "coherence": coherence,
+                    "max_abs": metrics["max_abs"],
+                    "variance": metrics["variance"],
+                },
+            },
+        }
+
+    def fast_forward(self, k: int, coherence_stride: int | None = None) -> Dict[str, Any]:
+        """Advance every universe ``k`` steps without input (see ``DSSEngine.advance``)."""
+        new_states, metrics = self.dss.advance_many(self.states, k, coherence_stride=coherence_stride)
+        self.states = new_states
+        self.t += k
+        coherence = metrics["coherence"]
+        return {
+            "t": self.t,
+            "coherence": coherence,
+            "regime": self.classify_regimes(coherence),
+            "metrics": metrics,
+        }
+
+    def universe_state(self, index: int) -> Any:
+        """Flat ``(dim,)`` view of one universe's state."""
+        return self.states[index].reshape(self.dim)
@@ -0,0 +1,150 @@
+"""
+Binary checkpoints for Omega144Core.
+
+Layout (little-endian, every section 8-byte aligned):
+
+    header   72 bytes, see _HEADER (magic, version, grid shape, t,
+             coupling, damping, event capacity/count, backend name)
+    state    dim x float64
+    events   n_events x int64 t, then n_events x float64 each for
+             coherence, max_abs, variance (oldest first)
+    kinds    n_events x uint8 ``KIND_*`` code each for coherence, max_abs,
+             variance, zero-padded to 8 bytes
+
+Loading memory-maps the file and copies each section straight into the
+engine's buffers; nothing is parsed beyond the fixed header. Streaming
+stats accumulators are not part of the checkpoint and start fresh.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Type, Union
+
+from .event_queue import EVENT_COLUMNS, METRIC_COLUMNS, EventQueue
+from .rc144_core import Omega144Core
+
+MAGIC = b"O144CKPT"
+VERSION = 1
+_HEADER = struct.Struct("<8sHHIIIqddII16s")
+_TYPECODES = {"t": "q", "coherence": "d", "max_abs": "d", "variance": "d"}
+_SWAP = sys.byteorder != "little"
+
+PathLike = Union[str, os.PathLike]
+
+
+def _to_bytes(values: array) -> bytes:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_buffer(typecode: str, buf) -> array:
+    out = array(typecode)
+    out.frombytes(buf)
+    if _SWAP:
+        out.byteswap()
+    return out
+
+
+def _kinds_size(n_events: int) -> int:
+    return -(-len(METRIC_COLUMNS) * n_events // 8) * 8
+
+
+def save_checkpoint(core: Omega144Core, path: PathLike) -> None:
+    """Write ``core`` to ``path`` atomically (temp file + rename)."""
+    queue = core.event_queue
+    window = queue.window()
+    kinds = queue.kinds()
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        core.n_domains,
+        core.domain_size,
+        queue.max_events,
+        core.t,
+        core.dss.coupling,
+        core.dss.damping,
+        len(queue),
+        0,
+        core.backend.encode("ascii"),
+    )
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(_to_bytes(array("d", core.state)))
+        for name in EVENT_COLUMNS:
+            f.write(_to_bytes(array(_TYPECODES[name], window[name])))
+        codes = b"".join(kinds[name].tobytes() for name in METRIC_COLUMNS)
+        f.write(codes.ljust(_kinds_size(len(queue)), b"\0"))
+        # On disk before the rename, so a crash never leaves a short file at ``path``.
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: PathLike, cls: Type[Omega144Core] = Omega144Core) -> Omega144Core:
+    """Rebuild the engine saved at ``path`` as a ``cls`` (an Omega144Core subclass)."""
+    with open(path, "rb") as f:
+        # Checked before mapping: mmap cannot map an empty file.
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise ValueError(f"{path}: truncated checkpoint header")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        (
+            magic,
+            version,
+            _,
+            n_domains,
+            domain_size,
+            max_events,
+            t,
+            coupling,
+            damping,
+            n_events,
+            _,
+            backend,
+        ) = _HEADER.unpack_from(mm)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not an Omega144Core checkpoint")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported checkpoint version {version}")
+        dim = n_domains * domain_size
+        expected = _HEADER.size + 8 * (dim + 4 * n_events) + _kinds_size(n_events)
+        if len(mm) != expected:
+            raise ValueError(f"{path}: expected {expected} bytes, found {len(mm)}")
+
+        core = cls(
+            n_domains=n_domains,
+            domain_size=domain_size,
+            backend=backend.rstrip(b"\0").decode("ascii"),
+            coupling=coupling,
+            damping=damping,
+        )
+        core.event_queue = EventQueue(max_events=max_events)
+        buf = memoryview(mm)
+        try:
+            off = _HEADER.size
+            core.state = core.dss.to_state(_from_buffer("d", buf[off : off + 8 * dim]))
+            off += 8 * dim
+            columns = {}
+            for name in EVENT_COLUMNS:
+                columns[name] = _from_buffer(_TYPECODES[name], buf[off : off + 8 * n_events])
+                off += 8 * n_events
+            kinds = {}
+            for name in METRIC_COLUMNS:
+                kinds[name] = bytes(buf[off : off + n_events])
+                off += n_events
+        finally:
+            buf.release()
+    core.event_queue.restore(columns, kinds)
+    core.t = t
+    return core
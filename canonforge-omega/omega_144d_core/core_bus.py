@@ -1,14 +1,32 @@
 """
 CoreBus · merges internal Ω-state and external vector for CanonForge Omega.
+
+Without an external vector the state is passed through as-is (no copy): the
+list/array DSS engines never mutate their input, they always return a fresh
+state. ``GridState`` (sparse backend) merges in place, and a ``SparseInput``
+is routed like the dense zero-filled vector it stands for.
 """
 
 from __future__ import annotations
 
 from typing import List, Optional
 
+from .dss_engine import GridState, SparseInput
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; list states are always supported
+    np = None
+
 
 class CoreBus:
     def route(self, state: List[float], ext: Optional[List[float]] = None) -> List[float]:
         if ext is None:
-            return state[:]
+            return state
+        if isinstance(state, GridState):
+            return state.merge(ext)
+        if isinstance(ext, SparseInput):
+            ext = ext.dense(len(state))
+        if np is not None and isinstance(state, np.ndarray):
+            return (state + np.asarray(ext, dtype=np.float64)) / 2.0
         return [(a + b) / 2.0 for a, b in zip(state, ext)]
@@ -5,11 +5,33 @@ Deep System Symmetry (DSS) Engine · CanonForge Omega
 - Each cell interacts with its row/column average.
 - Damping prevents runaway growth.
 - Coherence = inverse normalized variance in [0, 1].
+
+The update is linear, so a grid splits into four modes that evolve
+independently: the global mean g scales by (1 - damping + coupling), the
+row/column offsets (r_i - g, c_j - g) by (1 - damping + coupling / 2), and the
+residual x - r_i - c_j + g by (1 - damping). ``advance`` uses this to jump k
+steps ahead in O(dim) regardless of k.
+
+Three backends share the same update rule:
+
+- ``DSSEngine``: pure-Python lists, no dependencies (the default).
+- ``NumpyDSSEngine``: contiguous float64 ``(n_domains, domain_size)`` grids,
+  a handful of vectorized operations per step (requires numpy).
+- ``SparseDSSEngine``: large grids (up to ~1024×1024). The state is a
+  ``GridState`` updated in place that carries its row/column means and
+  residual energy, so no per-step reductions are needed, and external input
+  may be a ``SparseInput`` of (index, value) pairs (requires numpy).
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import math
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the pure-Python backend always works
+    np = None
 
 
 class DSSEngine:
@@ -26,6 +48,22 @@ class DSSEngine:
         self.coupling = float(coupling)
         self.damping = float(damping)
 
+    def to_state(self, vec: List[float]) -> List[float]:
+        """Convert a padded/truncated vector into this backend's state type."""
+        return vec if isinstance(vec, list) else list(vec)
+
+    def copy_state(self, state: List[float]) -> List[float]:
+        return state[:]
+
+    def fit_vector(self, vec) -> List[float]:
+        """``vec`` zero-padded or truncated to ``dim`` values, as a float list."""
+        v = [float(x) for x in vec]
+        if len(v) < self.dim:
+            v = v + [0.0] * (self.dim - len(v))
+        elif len(v) > self.dim:
+            v = v[: self.dim]
+        return v
+
     def _to_matrix(self, vec: List[float]) -> List[List[float]]:
         m = []
         idx = 0
@@ -40,12 +78,48 @@ class DSSEngine:
     def _to_vector(self, mat: List[List[float]]) -> List[float]:
         return [x for row in mat for x in row]
 
-    def _variance(self, v: List[float]) -> float:
-        n = len(v)
+    @staticmethod
+    def _spread(values: List[float], shift: float) -> Tuple[float, float]:
+        """
+        (max_abs, variance) in one pass. Deviations are accumulated around
+        ``shift``, an estimate of the mean, which keeps the sum of squares
+        numerically stable (shifted-data variance).
+        """
+        n = len(values)
         if n == 0:
-            return 0.0
-        mean = sum(v) / n
-        return sum((x - mean) ** 2 for x in v) / n
+            return 0.0, 0.0
+        s1 = s2 = max_abs = 0.0
+        for x in values:
+            d = x - shift
+            s1 += d
+            s2 += d * d
+            if x > max_abs:
+                max_abs = x
+            elif -x > max_abs:
+                max_abs = -x
+        if s2 != s2:  # a NaN value, which the max_abs comparisons skip
+            max_abs = math.nan
+        m = s1 / n
+        var = s2 / n - m * m
+        if var < 0.0:  # rounding; a comparison so NaN passes through
+            var = 0.0
+        return max_abs, var
+
+    @staticmethod
+    def _coherence(max_abs: float, var: float) -> float:
+        # A diverged grid has no coherence: NaN (regime CHAOTIC), not 1.0.
+        if not (math.isfinite(max_abs) and math.isfinite(var)):
+            return math.nan
+        if max_abs == 0:
+            return 1.0
+        norm_var = var / (max_abs * max_abs + 1e-9)  # overflows to inf, where ** would raise
+        coherence = 1.0 / (1.0 + norm_var)
+        return max(0.0, min(1.0, coherence))
+
+    def mode_factors(self, k: int) -> Tuple[float, float, float]:
+        """Gain of the (global, row/column, residual) modes after k steps."""
+        a = 1.0 - self.damping
+        return (a + self.coupling) ** k, (a + 0.5 * self.coupling) ** k, a**k
 
     def compute(self, state: List[float]) -> Tuple[List[float], Dict]:
         if len(state) != self.dim:
@@ -56,29 +130,514 @@ class DSSEngine:
             sum(mat[i][j] for i in range(self.n_domains)) / self.n_domains
             for j in range(self.domain_size)
         ]
-        new_mat: List[List[float]] = []
-        for i in range(self.n_domains):
-            new_row: List[float] = []
-            for j in range(self.domain_size):
-                x = mat[i][j]
-                neighborhood = 0.5 * (row_means[i] + col_means[j])
-                updated = (1.0 - self.damping) * x + self.coupling * neighborhood
-                new_row.append(updated)
-            new_mat.append(new_row)
-        new_vec = self._to_vector(new_mat)
-        max_abs = max((abs(x) for x in new_vec), default=0.0)
-        var = self._variance(new_vec)
-        if max_abs == 0:
-            coherence = 1.0
+        # The updated grid's mean is known up front ((1 - damping + coupling)
+        # times the current one), so max_abs and variance are accumulated in
+        # the same pass as the update, as deviations from that mean.
+        keep = 1.0 - self.damping
+        coupling = self.coupling
+        shift = (keep + coupling) * (sum(row_means) / self.n_domains) if self.n_domains else 0.0
+        new_vec: List[float] = []
+        append = new_vec.append
+        s1 = s2 = max_abs = 0.0
+        for row, r in zip(mat, row_means):
+            for x, c in zip(row, col_means):
+                updated = keep * x + coupling * (0.5 * (r + c))
+                append(updated)
+                d = updated - shift
+                s1 += d
+                s2 += d * d
+                if updated > max_abs:
+                    max_abs = updated
+                elif -updated > max_abs:
+                    max_abs = -updated
+        if new_vec:
+            m = s1 / len(new_vec)
+            var = s2 / len(new_vec) - m * m
+            if var < 0.0:  # rounding; a comparison so NaN passes through
+                var = 0.0
+            if s2 != s2:  # a NaN cell, which the max_abs comparisons skip
+                max_abs = math.nan
         else:
-            norm_var = var / (max_abs**2 + 1e-9)
-            coherence = 1.0 / (1.0 + norm_var)
-            coherence = max(0.0, min(1.0, coherence))
+            m = var = 0.0
+        coherence = self._coherence(max_abs, var)
         metrics = {
             "coherence": coherence,
             "row_means": row_means,
             "col_means": col_means,
             "max_abs": max_abs,
             "variance": var,
+            "mean": shift + m,
         }
         return new_vec, metrics
+
+    def _advance_means(self, means: List[float], g: float, k: int) -> List[float]:
+        fg, fm, _ = self.mode_factors(k)
+        return [fg * g + fm * (m - g) for m in means]
+
+    def output_means(self, metrics: Dict) -> Tuple[List[float], List[float]]:
+        """
+        Row and column means of the grid ``compute`` returned, derived from
+        the input means in its ``metrics`` (each mean evolves like the grid
+        it summarizes) instead of rescanning the grid.
+        """
+        row_means = metrics["row_means"]
+        g = sum(row_means) / self.n_domains if self.n_domains else 0.0
+        return self._advance_means(row_means, g, 1), self._advance_means(metrics["col_means"], g, 1)
+
+    def _advance_vector(
+        self, mat: List[List[float]], row_means: List[float], col_means: List[float], g: float, k: int
+    ) -> List[float]:
+        fg, fm, fe = self.mode_factors(k)
+        base = fg * g
+        out: List[float] = []
+        for i, row in enumerate(mat):
+            ri = row_means[i] - g
+            for j, x in enumerate(row):
+                cj = col_means[j] - g
+                out.append(base + fm * (ri + cj) + fe * (x - row_means[i] - col_means[j] + g))
+        return out
+
+    def advance(
+        self, state: List[float], k: int, coherence_stride: int | None = None
+    ) -> Tuple[List[float], Dict]:
+        """
+        Apply ``k`` steps without external input in closed form.
+
+        Returns the final state and the metrics ``compute`` would have
+        reported on the k-th step (row/column means are those of step k-1's
+        state). With ``coherence_stride=s`` the metrics also carry
+        ``coherence_samples``: coherence after steps s, 2s, ... <= k. Results
+        match k calls to ``compute`` up to floating-point rounding.
+        """
+        if len(state) != self.dim:
+            raise ValueError(f"Expected {self.dim} elements, got {len(state)}")
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        mat = self._to_matrix(state)
+        row_means = [sum(row) / self.domain_size for row in mat]
+        col_means = [
+            sum(mat[i][j] for i in range(self.n_domains)) / self.n_domains
+            for j in range(self.domain_size)
+        ]
+        g = sum(row_means) / self.n_domains if self.n_domains else 0.0
+
+        new_vec = self._advance_vector(mat, row_means, col_means, g, k)
+        mean = self.mode_factors(k)[0] * g
+        max_abs, var = self._spread(new_vec, mean)
+        metrics = {
+            "coherence": self._coherence(max_abs, var),
+            "row_means": self._advance_means(row_means, g, k - 1),
+            "col_means": self._advance_means(col_means, g, k - 1),
+            "max_abs": max_abs,
+            "variance": var,
+            "mean": mean,
+        }
+        if coherence_stride:
+            samples: List[float] = []
+            for step in range(coherence_stride, k + 1, coherence_stride):
+                if step == k:
+                    samples.append(metrics["coherence"])
+                    continue
+                vec = self._advance_vector(mat, row_means, col_means, g, step)
+                samples.append(self._coherence(*self._spread(vec, self.mode_factors(step)[0] * g)))
+            metrics["coherence_samples"] = samples
+        return new_vec, metrics
+
+
+class NumpyDSSEngine(DSSEngine):
+    """
+    Array backend for the DSS update.
+
+    States are float64 vectors of length ``dim`` backed by a contiguous
+    ``(n_domains, domain_size)`` grid, so reshaping between the two is free.
+    Results match :class:`DSSEngine` to floating-point tolerance; row and
+    column means are returned as arrays rather than lists.
+    """
+
+    def __init__(
+        self,
+        n_domains: int = 12,
+        domain_size: int = 12,
+        coupling: float = 0.18,
+        damping: float = 0.04,
+    ):
+        if np is None:
+            raise ImportError("NumpyDSSEngine requires numpy (pip install numpy)")
+        super().__init__(n_domains=n_domains, domain_size=domain_size, coupling=coupling, damping=damping)
+
+    def to_state(self, vec) -> Any:
+        return np.array(vec, dtype=np.float64)
+
+    def copy_state(self, state) -> Any:
+        return state.copy()
+
+    def fit_vector(self, vec) -> Any:
+        """Like ``DSSEngine.fit_vector`` but a float64 array (a view of ``vec`` when it already fits)."""
+        v = np.asarray(vec, dtype=np.float64).reshape(-1)
+        if v.size < self.dim:
+            return np.pad(v, (0, self.dim - v.size))
+        return v[: self.dim]
+
+    def to_grid(self, state) -> Any:
+        grid = np.ascontiguousarray(state, dtype=np.float64)
+        if grid.size != self.dim:
+            raise ValueError(f"Expected {self.dim} elements, got {grid.size}")
+        return grid.reshape(self.n_domains, self.domain_size)
+
+    def compute(self, state) -> Tuple[Any, Dict]:
+        grid = self.to_grid(state)
+        row_means = grid.mean(axis=1)
+        col_means = grid.mean(axis=0)
+        g = float(row_means.mean()) if self.n_domains else 0.0
+        # As in DSSEngine.compute: the update is built as deviations from the
+        # known output mean, so mean, variance and max_abs come from one sum,
+        # one sum of squares and the min/max, then the mean is added back.
+        keep = 1.0 - self.damping
+        half = 0.5 * self.coupling
+        shift = (keep + self.coupling) * g
+        dev = keep * grid
+        dev -= keep * g
+        dev += (half * (row_means - g))[:, None]
+        dev += (half * (col_means - g))[None, :]
+        flat = dev.reshape(self.dim)
+        if self.dim:
+            m = float(flat.sum()) / self.dim
+            var = float(flat @ flat) / self.dim - m * m
+            if var < 0.0:  # rounding; a comparison so NaN passes through
+                var = 0.0
+            max_abs = max(abs(float(flat.max()) + shift), abs(float(flat.min()) + shift))
+        else:
+            m = var = max_abs = 0.0
+        flat += shift
+        metrics = {
+            "coherence": self._coherence(max_abs, var),
+            "row_means": row_means,
+            "col_means": col_means,
+            "max_abs": max_abs,
+            "variance": var,
+            "mean": shift + m,
+        }
+        return flat, metrics
+
+    def _advance_means(self, means, g, k: int) -> Any:
+        fg, fm, _ = self.mode_factors(k)
+        g = np.asarray(g)
+        return (fg * g)[..., None] + fm * (means - g[..., None])
+
+    def output_means(self, metrics: Dict) -> Tuple[Any, Any]:
+        """Same as ``DSSEngine.output_means``; also accepts ``compute_many`` metrics."""
+        row_means = metrics["row_means"]
+        g = row_means.mean(axis=-1)
+        return self._advance_means(row_means, g, 1), self._advance_means(metrics["col_means"], g, 1)
+
+    def compute_many(self, grids) -> Tuple[Any, Dict]:
+        """
+        Advance a stack of independent grids shaped ``(N, n_domains, domain_size)``.
+
+        Returns the new stack and a metrics dict whose values are per-universe
+        arrays (``coherence``, ``max_abs``, ``variance`` shaped ``(N,)``;
+        ``row_means`` ``(N, n_domains)``; ``col_means`` ``(N, domain_size)``).
+        """
+        grids = np.asarray(grids, dtype=np.float64)
+        if grids.ndim != 3 or grids.shape[1:] != (self.n_domains, self.domain_size):
+            raise ValueError(
+                f"Expected shape (N, {self.n_domains}, {self.domain_size}), got {grids.shape}"
+            )
+        row_means = grids.mean(axis=2)
+        col_means = grids.mean(axis=1)
+        new_grids = (1.0 - self.damping) * grids
+        new_grids += self.coupling * (0.5 * (row_means[:, :, None] + col_means[:, None, :]))
+        flat = new_grids.reshape(len(new_grids), self.dim)
+        max_abs = np.abs(flat).max(axis=1) if self.dim else np.zeros(len(flat))
+        var = flat.var(axis=1) if self.dim else np.zeros(len(flat))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coherence = 1.0 / (1.0 + var / (max_abs**2 + 1e-9))
+        coherence = np.where(max_abs == 0, 1.0, np.clip(coherence, 0.0, 1.0))
+        metrics = {
+            "coherence": coherence,
+            "row_means": row_means,
+            "col_means": col_means,
+            "max_abs": max_abs,
+            "variance": var,
+            "mean": self.mode_factors(1)[0] * row_means.mean(axis=1),
+        }
+        return new_grids, metrics
+
+    def _advance_grids(self, grids, row_means, col_means, g, k: int) -> Any:
+        fg, fm, fe = self.mode_factors(k)
+        r = row_means - g[..., None]
+        c = col_means - g[..., None]
+        out = fe * (grids - row_means[..., :, None] - col_means[..., None, :] + g[..., None, None])
+        out += fm * (r[..., :, None] + c[..., None, :])
+        out += (fg * g)[..., None, None]
+        return out
+
+    def advance_many(self, grids, k: int, coherence_stride: int | None = None) -> Tuple[Any, Dict]:
+        """Closed-form ``advance`` over a stack of ``(N, n_domains, domain_size)`` grids."""
+        grids = np.asarray(grids, dtype=np.float64)
+        if grids.ndim != 3 or grids.shape[1:] != (self.n_domains, self.domain_size):
+            raise ValueError(
+                f"Expected shape (N, {self.n_domains}, {self.domain_size}), got {grids.shape}"
+            )
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        row_means = grids.mean(axis=2)
+        col_means = grids.mean(axis=1)
+        g = row_means.mean(axis=1)
+
+        def summarize(out):
+            flat = out.reshape(len(out), self.dim)
+            max_abs = np.abs(flat).max(axis=1) if self.dim else np.zeros(len(flat))
+            var = flat.var(axis=1) if self.dim else np.zeros(len(flat))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                coherence = 1.0 / (1.0 + var / (max_abs**2 + 1e-9))
+            return max_abs, var, np.where(max_abs == 0, 1.0, np.clip(coherence, 0.0, 1.0))
+
+        new_grids = self._advance_grids(grids, row_means, col_means, g, k)
+        max_abs, var, coherence = summarize(new_grids)
+        fg, fm, _ = self.mode_factors(k - 1)
+        metrics = {
+            "coherence": coherence,
+            "row_means": (fg * g)[:, None] + fm * (row_means - g[:, None]),
+            "col_means": (fg * g)[:, None] + fm * (col_means - g[:, None]),
+            "max_abs": max_abs,
+            "variance": var,
+            "mean": self.mode_factors(k)[0] * g,
+        }
+        if coherence_stride:
+            steps = list(range(coherence_stride, k + 1, coherence_stride))
+            samples = np.empty((len(grids), len(steps)), dtype=np.float64)
+            for n, step in enumerate(steps):
+                out = new_grids if step == k else self._advance_grids(grids, row_means, col_means, g, step)
+                samples[:, n] = summarize(out)[2]
+            metrics["coherence_samples"] = samples
+        return new_grids, metrics
+
+    def advance(self, state, k: int, coherence_stride: int | None = None) -> Tuple[Any, Dict]:
+        grid = self.to_grid(state)
+        new_grids, many = self.advance_many(grid[None], k, coherence_stride=coherence_stride)
+        metrics = {
+            "coherence": float(many["coherence"][0]),
+            "row_means": many["row_means"][0],
+            "col_means": many["col_means"][0],
+            "max_abs": float(many["max_abs"][0]),
+            "variance": float(many["variance"][0]),
+            "mean": float(many["mean"][0]),
+        }
+        if coherence_stride:
+            metrics["coherence_samples"] = many["coherence_samples"][0]
+        return new_grids[0].reshape(self.dim), metrics
+
+
+class SparseInput(NamedTuple):
+    """
+    External input that drives only some cells: ``values[k]`` goes to flat
+    index ``indices[k]``, every other cell is 0. Routing it is equivalent to
+    routing the dense zero-filled vector, without building one.
+    """
+
+    indices: Sequence[int]
+    values: Sequence[float]
+
+    @classmethod
+    def from_dict(cls, cells: Dict[int, float]) -> "SparseInput":
+        return cls(list(cells), list(cells.values()))
+
+    def dense(self, dim: int) -> List[float]:
+        out = [0.0] * dim
+        for i, v in zip(self.indices, self.values):
+            if not 0 <= i < dim:
+                raise ValueError(f"Sparse input index {i} out of range for {dim} cells")
+            out[i] += float(v)
+        return out
+
+
+class GridState:
+    """
+    In-place state of ``SparseDSSEngine``: a float64 grid plus what the DSS
+    update needs from it, kept current without rescanning the grid.
+
+    The true grid is ``scale * grid`` (routing halves the state lazily).
+    ``row_means``/``col_means`` are those of the true grid, and
+    ``residual_ss`` is the energy of its residual mode
+    (``sum((x - r_i - c_j + g) ** 2)``), which the update only rescales.
+    Iterating, ``len`` and ``numpy.asarray`` see the flat true state.
+    """
+
+    def __init__(self, grid, resync_every: int = 256):
+        self.grid = grid
+        self.scale = 1.0
+        self.resync_every = resync_every
+        self.sync()
+
+    def sync(self) -> None:
+        """Recompute means and residual energy from the grid (O(n·m))."""
+        if self.scale != 1.0:
+            self.grid *= self.scale
+            self.scale = 1.0
+        grid = self.grid
+        self.row_means = grid.mean(axis=1)
+        self.col_means = grid.mean(axis=0)
+        g = self.row_means.mean() if len(self.row_means) else 0.0
+        resid = grid - self.row_means[:, None]
+        resid -= self.col_means[None, :] - g
+        self.residual_ss = float(np.einsum("ij,ij->", resid, resid))
+        self._since_sync = 0
+
+    def copy(self) -> "GridState":
+        out = GridState.__new__(GridState)
+        out.grid = self.grid.copy()
+        out.scale = self.scale
+        out.resync_every = self.resync_every
+        out.row_means = self.row_means.copy()
+        out.col_means = self.col_means.copy()
+        out.residual_ss = self.residual_ss
+        out._since_sync = self._since_sync
+        return out
+
+    def flat(self) -> Any:
+        """Flat true state (a view when no lazy scale is pending)."""
+        flat = self.grid.reshape(-1)
+        return flat if self.scale == 1.0 else flat * self.scale
+
+    def __array__(self, dtype=None, copy=None):
+        flat = self.flat()
+        return flat if dtype is None else flat.astype(dtype)
+
+    def __len__(self) -> int:
+        return self.grid.size
+
+    def __iter__(self):
+        return iter(self.flat().tolist())
+
+    def __getitem__(self, index):
+        return self.flat()[index]
+
+    def merge(self, ext) -> "GridState":
+        """``(state + ext) / 2`` in place; ``ext`` is a ``SparseInput`` or a dense vector."""
+        n, m = self.grid.shape
+        if not isinstance(ext, SparseInput):
+            self.grid *= 0.5 * self.scale
+            self.grid += 0.5 * np.asarray(ext, dtype=np.float64).reshape(n, m)
+            self.scale = 1.0
+            self.sync()
+            return self
+
+        idx, inverse = np.unique(np.asarray(ext.indices, dtype=np.int64), return_inverse=True)
+        if len(idx) and (idx[0] < 0 or idx[-1] >= n * m):
+            bad = idx[0] if idx[0] < 0 else idx[-1]
+            raise ValueError(f"Sparse input index {bad} out of range for {n * m} cells")
+        vals = np.bincount(inverse.reshape(-1), weights=np.asarray(ext.values, dtype=np.float64), minlength=len(idx))
+        rows, cols = np.divmod(idx, m)
+        r, c = self.row_means, self.col_means
+        g = r.mean()
+
+        # Residual energy of (x + e) / 2: the input's own residual energy plus
+        # the cross term, which only involves the driven cells.
+        flat = self.grid.reshape(-1)
+        x_resid = self.scale * flat[idx] - r[rows] - c[cols] + g
+        r_in = np.bincount(rows, weights=vals, minlength=n) / m
+        c_in = np.bincount(cols, weights=vals, minlength=m) / n
+        g_in = vals.sum() / (n * m)
+        in_ss = float(vals @ vals) - n * m * g_in**2 - m * float(((r_in - g_in) ** 2).sum()) - n * float(((c_in - g_in) ** 2).sum())
+        residual_ss = 0.25 * self.residual_ss + 0.5 * float(x_resid @ vals) + 0.25 * in_ss
+        self.residual_ss = 0.0 if residual_ss < 0.0 else residual_ss  # NaN passes through
+
+        self.row_means = 0.5 * (r + r_in)
+        self.col_means = 0.5 * (c + c_in)
+        flat[idx] += vals / self.scale
+        self.scale *= 0.5
+        return self
+
+
+class SparseDSSEngine(NumpyDSSEngine):
+    """
+    DSS backend for large grids and sparse input.
+
+    ``compute`` updates a ``GridState`` in place: one scaled multiply and two
+    broadcast adds over the grid plus a min/max pass for ``max_abs``. Row and
+    column means follow from the previous ones in closed form and the
+    variance from the mode energies (O(n + m)); the state resyncs them from
+    the grid every ``resync_every`` steps to shed rounding drift. Routing a
+    ``SparseInput`` costs O(n + m + nnz). Unlike the other backends, the
+    state passed to ``compute`` is modified and returned.
+    """
+
+    def __init__(
+        self,
+        n_domains: int = 12,
+        domain_size: int = 12,
+        coupling: float = 0.18,
+        damping: float = 0.04,
+        resync_every: int = 256,
+    ):
+        super().__init__(n_domains=n_domains, domain_size=domain_size, coupling=coupling, damping=damping)
+        self.resync_every = resync_every
+
+    def to_state(self, vec) -> GridState:
+        if isinstance(vec, GridState):
+            return vec
+        return GridState(self.to_grid(np.array(vec, dtype=np.float64)), self.resync_every)
+
+    def copy_state(self, state: GridState) -> GridState:
+        return state.copy()
+
+    def compute(self, state) -> Tuple[GridState, Dict]:
+        if not isinstance(state, GridState):
+            state = self.to_state(state)
+        n, m = state.grid.shape
+        r, c = state.row_means, state.col_means
+        g = r.mean() if n else 0.0
+
+        keep = 1.0 - self.damping
+        half = 0.5 * self.coupling
+        grid = state.grid
+        grid *= keep * state.scale
+        grid += (half * r)[:, None]
+        grid += (half * c)[None, :]
+        state.scale = 1.0
+
+        fg, fm, fe = self.mode_factors(1)
+        new_g = fg * g
+        state.row_means = new_g + fm * (r - g)
+        state.col_means = new_g + fm * (c - g)
+        state.residual_ss *= fe * fe
+        state._since_sync += 1
+        if state._since_sync >= state.resync_every:
+            state.sync()
+
+        rows_ss = float(((state.row_means - new_g) ** 2).sum())
+        cols_ss = float(((state.col_means - new_g) ** 2).sum())
+        var = (m * rows_ss + n * cols_ss + state.residual_ss) / (n * m) if grid.size else 0.0
+        if var < 0.0:  # rounding; a comparison so NaN passes through
+            var = 0.0
+        max_abs = max(float(grid.max()), -float(grid.min())) if grid.size else 0.0
+        metrics = {
+            "coherence": self._coherence(max_abs, var),
+            "row_means": r,
+            "col_means": c,
+            "max_abs": max_abs,
+            "variance": var,
+            "mean": float(new_g),
+        }
+        return state, metrics
+
+    def advance(self, state, k: int, coherence_stride: int | None = None) -> Tuple[GridState, Dict]:
+        new_flat, metrics = super().advance(np.asarray(state), k, coherence_stride=coherence_stride)
+        return GridState(new_flat.reshape(self.n_domains, self.domain_size), self.resync_every), metrics
+
+
+BACKENDS = {
+    "python": DSSEngine,
+    "numpy": NumpyDSSEngine,
+    "sparse": SparseDSSEngine,
+}
+
+
+def make_dss_engine(backend: str = "python", **kwargs) -> DSSEngine:
+    """Build a DSS engine for ``backend`` ("python", "numpy" or "sparse")."""
+    try:
+        cls = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown DSS backend {backend!r}; expected one of {sorted(BACKENDS)}") from None
+    return cls(**kwargs)
@@ -0,0 +1,177 @@
+"""
+Ensemble runner · parallel Omega144Core parameter sweeps.
+
+Each job is (initial_vector, coupling, damping, steps). Jobs run on a
+process pool; initial and final states travel through one shared-memory
+block of ``len(jobs) * dim`` float64 values (row ``i`` belongs to job ``i``)
+instead of being pickled, and only a small per-run summary is sent back.
+Summaries stream out of ``EnsembleRunner.run`` in completion order.
+
+    with EnsembleRunner(jobs) as runner:
+        for res in runner.run():
+            print(res.index, res.final_coherence, res.regime_timeline)
+        final = runner.final_state(0)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Iterator, List, Sequence, Tuple
+
+from .rc144_core import Omega144Core
+from .regimes import classify_regimes, label_runs, regime_runs
+
+
+@dataclass
+class EnsembleJob:
+    initial_vector: Sequence[float]
+    coupling: float = 0.18
+    damping: float = 0.04
+    steps: int = 100
+
+
+@dataclass
+class EnsembleResult:
+    index: int
+    coupling: float
+    damping: float
+    steps: int
+    final_coherence: float
+    final_regime: str
+    # (regime, first_t, length) runs, in time order
+    regime_timeline: List[Tuple[str, int, int]] = field(default_factory=list)
+    elapsed_sec: float = 0.0
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # The parent owns (and unlinks) the block. From 3.13 workers attach
+    # untracked; before that, forked workers share the parent's resource
+    # tracker, so the plain attach's registration is the parent's own.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _run_job(
+    shm_name: str,
+    index: int,
+    n_domains: int,
+    domain_size: int,
+    backend: str,
+    coupling: float,
+    damping: float,
+    steps: int,
+) -> EnsembleResult:
+    started = time.perf_counter()
+    dim = n_domains * domain_size
+    shm = _attach(shm_name)
+    states = shm.buf.cast("d")
+    row = states[index * dim : (index + 1) * dim]
+    try:
+        core = Omega144Core(
+            n_domains=n_domains,
+            domain_size=domain_size,
+            backend=backend,
+            track_stats=False,
+            coupling=coupling,
+            damping=damping,
+        )
+        core.initialize(row.tolist())
+
+        coherence = array("d")
+        step = core.step
+        for _ in range(steps):
+            coherence.append(step(detail="minimal")["coherence"])
+        timeline = label_runs(regime_runs(classify_regimes(coherence)))
+
+        row[:] = array("d", core.state)
+    finally:
+        # Views must be released before close(), or it raises BufferError
+        # and hides whatever the step loop raised.
+        row.release()
+        states.release()
+        shm.close()
+    return EnsembleResult(
+        index=index,
+        coupling=coupling,
+        damping=damping,
+        steps=steps,
+        final_coherence=coherence[-1] if steps else 1.0,
+        final_regime=timeline[-1][0] if timeline else core.classify_regime(1.0),
+        regime_timeline=timeline,
+        elapsed_sec=time.perf_counter() - started,
+    )
+
+
+class EnsembleRunner:
+    def __init__(
+        self,
+        jobs: Sequence[EnsembleJob],
+        n_domains: int = 12,
+        domain_size: int = 12,
+        backend: str = "python",
+        max_workers: int | None = None,
+    ):
+        self.jobs = list(jobs)
+        self.n_domains = n_domains
+        self.domain_size = domain_size
+        self.dim = n_domains * domain_size
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, len(self.jobs) * self.dim * 8))
+        self._states = self._shm.buf.cast("d")
+        for i, job in enumerate(self.jobs):
+            v = [float(x) for x in job.initial_vector[: self.dim]]
+            v += [0.0] * (self.dim - len(v))
+            self._states[i * self.dim : (i + 1) * self.dim] = array("d", v)
+
+    def run(self) -> Iterator[EnsembleResult]:
+        """Run every job, yielding summaries as they finish (completion order)."""
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_job,
+                    self._shm.name,
+                    i,
+                    self.n_domains,
+                    self.domain_size,
+                    self.backend,
+                    float(job.coupling),
+                    float(job.damping),
+                    int(job.steps),
+                )
+                for i, job in enumerate(self.jobs)
+            ]
+            for fut in as_completed(futures):
+                yield fut.result()
+
+    def final_state(self, index: int) -> List[float]:
+        """State of job ``index`` (its initial vector until the job has run)."""
+        return self._states[index * self.dim : (index + 1) * self.dim].tolist()
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._states.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "EnsembleRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def run_ensemble(jobs: Sequence[EnsembleJob], **kwargs) -> List[EnsembleResult]:
+    """Run ``jobs`` and return their summaries ordered by job index."""
+    with EnsembleRunner(jobs, **kwargs) as runner:
+        return sorted(runner.run(), key=lambda r: r.index)
@@ -1,16 +1,46 @@
 """
 Event Queue & Time Evolution for CanonForge Omega.
+
+Events live in a fixed-capacity ring of typed columns (``t`` as int64,
+``coherence``/``max_abs``/``variance`` as float64). Every value is written
+twice, at ``slot`` and ``slot + capacity``, so the latest ``n`` events are
+always one contiguous, time-ordered slice: appends are O(1) and ``window``
+hands out zero-copy ``memoryview`` slices (wrap them with
+``numpy.frombuffer`` if you want arrays). Missing metrics are stored as NaN;
+a parallel ``kinds`` column per metric records whether each value was
+missing, a float or an int, so ``get_events`` returns exactly what was
+ticked in.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+EVENT_COLUMNS = ("t", "coherence", "max_abs", "variance")
+METRIC_COLUMNS = EVENT_COLUMNS[1:]
+_TYPECODES = {"t": "q", "coherence": "d", "max_abs": "d", "variance": "d"}
+
+# Codes of the per-metric ``kinds`` columns.
+KIND_MISSING, KIND_FLOAT, KIND_INT = 0, 1, 2
 
 
 class EventQueue:
     def __init__(self, max_events: int = 500):
+        if max_events < 1:
+            raise ValueError(f"max_events must be >= 1, got {max_events}")
         self.max_events = max_events
-        self.events: List[Dict[str, Any]] = []
+        self._columns: Dict[str, array] = {
+            name: array(code, bytes(2 * max_events * array(code).itemsize))
+            for name, code in _TYPECODES.items()
+        }
+        self._kinds: Dict[str, array] = {name: array("B", bytes(2 * max_events)) for name in METRIC_COLUMNS}
+        self._head = 0  # next slot to write, in [0, max_events)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
 
     def tick(self, t: int, state: List[float], metrics: Dict) -> Tuple[List[float], List[Dict[str, Any]]]:
         event = {
@@ -19,10 +49,93 @@ class EventQueue:
             "max_abs": metrics.get("max_abs"),
             "variance": metrics.get("variance"),
         }
-        self.events.append(event)
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events :]
+        i = self._head
+        j = i + self.max_events
+        cols = self._columns
+        kinds = self._kinds
+        cols["t"][i] = cols["t"][j] = t
+        for name in METRIC_COLUMNS:
+            value = event[name]
+            if value is None:
+                kinds[name][i] = kinds[name][j] = KIND_MISSING
+                cols[name][i] = cols[name][j] = math.nan
+            else:
+                kinds[name][i] = kinds[name][j] = KIND_INT if value.__class__ is int else KIND_FLOAT
+                cols[name][i] = cols[name][j] = value
+        self._head = (i + 1) % self.max_events
+        if self._count < self.max_events:
+            self._count += 1
         return state, [event]
 
+    def _bounds(self, n: Optional[int]) -> Tuple[int, int]:
+        n = self._count if n is None else max(0, min(int(n), self._count))
+        stop = self._head + self.max_events
+        return stop - n, stop
+
+    def window(self, n: Optional[int] = None) -> Dict[str, memoryview]:
+        """
+        Zero-copy views of the latest ``n`` events (all retained events by
+        default), oldest first, keyed by column name. The views alias the
+        ring, so later ticks overwrite them; copy anything you keep.
+        """
+        start, stop = self._bounds(n)
+        return {name: memoryview(col)[start:stop] for name, col in self._columns.items()}
+
+    def column(self, name: str, n: Optional[int] = None) -> memoryview:
+        start, stop = self._bounds(n)
+        return memoryview(self._columns[name])[start:stop]
+
+    def kinds(self, n: Optional[int] = None) -> Dict[str, memoryview]:
+        """Zero-copy views of the ``KIND_*`` codes matching ``window(n)``."""
+        start, stop = self._bounds(n)
+        return {name: memoryview(col)[start:stop] for name, col in self._kinds.items()}
+
+    def restore(self, columns: Dict[str, Any], kinds: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Replace the history with ``columns`` (equal-length, oldest first,
+        anything exposing the buffer protocol or a sequence). Only the
+        newest ``max_events`` entries are kept. Without ``kinds``, NaN
+        values are restored as missing and everything else as floats.
+        """
+        n = len(columns["t"])
+        keep = min(n, self.max_events)
+        for name, code in _TYPECODES.items():
+            src = columns[name][n - keep :]
+            if not isinstance(src, array) or src.typecode != code:
+                src = array(code, src)
+            col = self._columns[name]
+            col[0:keep] = src
+            col[self.max_events : self.max_events + keep] = src
+            if name in self._kinds:
+                if kinds is not None:
+                    codes = array("B", kinds[name][n - keep :])
+                else:
+                    codes = array("B", (KIND_MISSING if math.isnan(v) else KIND_FLOAT for v in src))
+                kcol = self._kinds[name]
+                kcol[0:keep] = codes
+                kcol[self.max_events : self.max_events + keep] = codes
+        self._count = keep
+        self._head = keep % self.max_events
+
     def get_events(self) -> List[Dict[str, Any]]:
-        return list(self.events)
+        """Retained events as dicts, oldest first (compatibility layer)."""
+        start, stop = self._bounds(None)
+        cols = self._columns
+        kinds = self._kinds
+        out: List[Dict[str, Any]] = []
+        for k in range(start, stop):
+            event: Dict[str, Any] = {"t": cols["t"][k]}
+            for name in METRIC_COLUMNS:
+                kind = kinds[name][k]
+                if kind == KIND_MISSING:
+                    event[name] = None
+                elif kind == KIND_INT:
+                    event[name] = int(cols[name][k])
+                else:
+                    event[name] = cols[name][k]
+            out.append(event)
+        return out
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return self.get_events()
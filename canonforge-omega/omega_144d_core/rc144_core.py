@@ -2,74 +2,168 @@
 CanonForge Omega · 144D Core Engine
 
 High-level façade over the Deep System Symmetry (DSS) engine.
+
+``backend`` selects the DSS implementation: ``"python"`` (lists, default),
+``"numpy"`` (contiguous float64 arrays, see ``NumpyDSSEngine``) or
+``"sparse"`` (large grids updated in place, see ``SparseDSSEngine``).
+``step`` also accepts a ``SparseInput`` of (index, value) pairs instead of
+a dense input vector.
 """
 
 from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-from .dss_engine import DSSEngine
+from .dss_engine import SparseInput, make_dss_engine
 from .event_queue import EventQueue
 from .core_bus import CoreBus
 from .subverse_core import SubverseCore
+from .stats import MetricAccumulator
+from .regimes import REGIME_LABELS, REGIME_THRESHOLDS, regime_code
+
+# Result shapes for ``Omega144Core.step(detail=...)``, cheapest first.
+STEP_DETAILS = ("minimal", "metrics", "full")
+
+# Scalar DSS metrics summarized across steps when ``track_stats`` is on.
+TRACKED_METRICS = ("coherence", "variance", "max_abs", "mean")
 
 
 class Omega144Core:
-    def __init__(self, n_domains: int = 12, domain_size: int = 12):
+    def __init__(
+        self,
+        n_domains: int = 12,
+        domain_size: int = 12,
+        backend: str = "python",
+        track_stats: bool = True,
+        coupling: float = 0.18,
+        damping: float = 0.04,
+    ):
         self.n_domains = n_domains
         self.domain_size = domain_size
         self.dim = n_domains * domain_size
+        self.backend = backend
 
-        self.dss = DSSEngine(n_domains=n_domains, domain_size=domain_size)
+        self.dss = make_dss_engine(
+            backend, n_domains=n_domains, domain_size=domain_size, coupling=coupling, damping=damping
+        )
         self.event_queue = EventQueue()
         self.bus = CoreBus()
         self.subverse = SubverseCore(n_domains=n_domains, domain_size=domain_size)
 
-        self.state: List[float] = [0.0] * self.dim
+        self.state: List[float] = self.dss.to_state([0.0] * self.dim)
         self.t: int = 0
 
+        # Long-run summaries (running mean, EWMA, min/max, quantiles) of the
+        # tracked DSS metrics; None when track_stats is off.
+        self.stats: Dict[str, MetricAccumulator] | None = (
+            {name: MetricAccumulator() for name in TRACKED_METRICS} if track_stats else None
+        )
+
     def _to_vector(self, vec: Optional[List[float]]) -> List[float]:
         if vec is None:
-            return self.state[:]
-        v = [float(x) for x in vec]
-        if len(v) < self.dim:
-            v = v + [0.0] * (self.dim - len(v))
-        elif len(v) > self.dim:
-            v = v[: self.dim]
-        return v
+            return self.dss.copy_state(self.state)
+        if isinstance(vec, SparseInput):  # routed as-is, never padded
+            return vec
+        # Array backends pad/truncate with numpy; no per-element conversion.
+        return self.dss.fit_vector(vec)
 
     def initialize(self, initial_vector):
-        self.state = self._to_vector(initial_vector)
+        if isinstance(initial_vector, SparseInput):
+            initial_vector = initial_vector.dense(self.dim)
+        self.state = self.dss.to_state(self._to_vector(initial_vector))
         self.t = 0
 
     def classify_regime(self, coherence: float) -> str:
-        if coherence >= 0.80:
-            return "COHERENT"
-        if coherence >= 0.60:
-            return "STABILIZING"
-        if coherence >= 0.40:
-            return "DRIFT"
-        return "CHAOTIC"
-
-    def step(self, input_vector=None, tag: str | None = None):
+        return REGIME_LABELS[regime_code(coherence)]
+
+    def save_checkpoint(self, path) -> None:
+        """Write state, ``t``, event history and DSS parameters to a binary checkpoint."""
+        from .checkpoint import save_checkpoint
+
+        save_checkpoint(self, path)
+
+    @classmethod
+    def load_checkpoint(cls, path) -> "Omega144Core":
+        """Restore an engine written by ``save_checkpoint`` as an instance of ``cls``."""
+        from .checkpoint import load_checkpoint
+
+        return load_checkpoint(path, cls)
+
+    def _track(self, metrics: Dict) -> None:
+        if self.stats is not None:
+            for name, acc in self.stats.items():
+                acc.update(metrics.get(name))
+
+    def stats_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Snapshot of the running accumulators, one per ``TRACKED_METRICS``
+        entry; each carries its running ``mean``. ``stats_summary()["mean"]``
+        tracks the grid mean itself.
+        """
+        if self.stats is None:
+            return {}
+        return {name: acc.summary() for name, acc in self.stats.items()}
+
+    def step(self, input_vector=None, tag: str | None = None, detail: str = "full"):
+        """
+        Advance one step and report it at the requested ``detail``:
+
+        - ``"minimal"``: ``t``, ``tag``, ``coherence`` and ``regime`` only.
+        - ``"metrics"``: adds the DSS ``metrics`` dict.
+        - ``"full"`` (default): adds a copy of ``state``, the triggered
+          ``events`` and the Ω188 ``overlay``.
+
+        The state copy and overlay are only built for ``"full"``; the engine
+        state and event history advance identically in every mode.
+        """
+        if detail not in STEP_DETAILS:
+            raise ValueError(f"Unknown detail {detail!r}; expected one of {STEP_DETAILS}")
         ext = self._to_vector(input_vector) if input_vector is not None else None
         merged = self.bus.route(self.state, ext)
         dss_state, dss_metrics = self.dss.compute(merged)
         self.t += 1
         event_state, triggered = self.event_queue.tick(self.t, dss_state, dss_metrics)
-        overlay = self.subverse.expand(event_state, dss_metrics)
 
         self.state = event_state
         coherence = dss_metrics.get("coherence", 0.0)
         regime = self.classify_regime(coherence)
+        self._track(dss_metrics)
 
+        if detail == "minimal":
+            return {"t": self.t, "tag": tag, "coherence": coherence, "regime": regime}
+        if detail == "metrics":
+            return {"t": self.t, "tag": tag, "coherence": coherence, "regime": regime, "metrics": dss_metrics}
         return {
             "t": self.t,
             "tag": tag,
-            "state": self.state[:],
+            "state": self.dss.copy_state(self.state),
             "coherence": coherence,
             "regime": regime,
             "metrics": dss_metrics,
             "events": triggered,
-            "overlay": overlay,
+            "overlay": self.subverse.expand(event_state, dss_metrics, *self.dss.output_means(dss_metrics)),
+        }
+
+    def fast_forward(self, k: int, coherence_stride: int | None = None, tag: str | None = None):
+        """
+        Advance ``k`` steps with no external input in one closed-form jump.
+
+        Only the final state and metrics are produced: no per-step events or
+        overlays, and a single event is logged at the final ``t``. Pass
+        ``coherence_stride`` to get ``metrics["coherence_samples"]``, the
+        coherence after every ``coherence_stride``-th step.
+        """
+        new_state, dss_metrics = self.dss.advance(self.state, k, coherence_stride=coherence_stride)
+        self.t += k
+        event_state, _ = self.event_queue.tick(self.t, new_state, dss_metrics)
+        self.state = event_state
+        coherence = dss_metrics.get("coherence", 0.0)
+        self._track(dss_metrics)
+        return {
+            "t": self.t,
+            "tag": tag,
+            "state": self.dss.copy_state(self.state),
+            "coherence": coherence,
+            "regime": self.classify_regime(coherence),
+            "metrics": dss_metrics,
         }
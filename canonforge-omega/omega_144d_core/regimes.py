@@ -0,0 +1,71 @@
+"""
+Regime classification over coherence values.
+
+A regime code is the number of ``REGIME_THRESHOLDS`` a coherence value
+reaches, i.e. an index into ``REGIME_LABELS``. ``classify_regimes`` buckets
+whole coherence arrays at once (``numpy.searchsorted`` when numpy is
+available), and ``regime_runs`` run-length encodes a code sequence so long
+runs can be summarized as a handful of ``(code, start_t, length)`` runs.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from itertools import groupby
+from typing import Any, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the array-module path always works
+    np = None
+
+# Regime labels indexed by code, and the coherence floor of each code above 0.
+REGIME_LABELS = ("CHAOTIC", "DRIFT", "STABILIZING", "COHERENT")
+REGIME_THRESHOLDS = (0.40, 0.60, 0.80)
+
+
+def regime_code(coherence: float) -> int:
+    # NaN reaches no threshold (bisect alone would file it under the top code).
+    return bisect_right(REGIME_THRESHOLDS, coherence) if coherence == coherence else 0
+
+
+def classify_regimes(coherence: Iterable[float]) -> Any:
+    """
+    Regime codes for a sequence of coherence values: an int8 ndarray for
+    ndarray input, otherwise an ``array("b")``.
+    """
+    if np is not None and isinstance(coherence, np.ndarray):
+        codes = np.searchsorted(REGIME_THRESHOLDS, coherence, side="right").astype(np.int8)
+        codes[np.isnan(coherence)] = 0
+        return codes
+    return array("b", map(regime_code, coherence))
+
+
+def regime_runs(codes: Any, t0: int = 1) -> List[Tuple[int, int, int]]:
+    """
+    Run-length encode regime codes as ``(code, start_t, length)`` tuples,
+    where ``codes[i]`` is the regime at ``t0 + i``.
+    """
+    if np is not None and isinstance(codes, np.ndarray):
+        if not len(codes):
+            return []
+        starts = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+        lengths = np.diff(np.append(starts, len(codes)))
+        return [
+            (int(code), int(start) + t0, int(length))
+            for code, start, length in zip(codes[starts].tolist(), starts.tolist(), lengths.tolist())
+        ]
+    runs: List[Tuple[int, int, int]] = []
+    t = t0
+    for code, group in groupby(codes):
+        length = sum(1 for _ in group)
+        runs.append((int(code), t, length))
+        t += length
+    return runs
+
+
+def label_runs(runs: List[Tuple[int, int, int]]) -> List[Tuple[str, int, int]]:
+    """``regime_runs`` output with codes replaced by their labels."""
+    return [(REGIME_LABELS[code], start, length) for code, start, length in runs]
@@ -0,0 +1,181 @@
+"""
+Server-held Omega144Core sessions.
+
+``SessionStore`` keeps engines alive between requests so a client can
+advance one by ``k`` steps at a time. The store is bounded: sessions idle
+for longer than ``ttl`` seconds expire, and creating a session beyond
+``max_sessions`` evicts the least recently used one.
+
+``advance_session`` returns coherence samples column-wise (``t`` of the
+first sample, the sample stride, coherence array, regime codes indexing
+``REGIME_LABELS``); ``encode_columns`` packs them into a compact
+little-endian binary frame:
+
+    header  <qII  t of the first sample, number of samples n, stride
+    body    n float64 coherence values, then n int8 regime codes
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import threading
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from .rc144_core import Omega144Core
+from .regimes import classify_regimes
+
+_FRAME_HEADER = struct.Struct("<qII")
+
+
+class EngineSession:
+    def __init__(self, core: Omega144Core):
+        self.id = uuid.uuid4().hex
+        self.core = core
+        self.lock = threading.Lock()  # one request advances a session at a time
+        self.created_at = time.time()
+        self.last_used = time.monotonic()
+
+    def info(self) -> Dict[str, Any]:
+        core = self.core
+        return {
+            "session_id": self.id,
+            "n_domains": core.n_domains,
+            "domain_size": core.domain_size,
+            "backend": core.backend,
+            "t": core.t,
+            "created_at": self.created_at,
+            "idle_sec": round(time.monotonic() - self.last_used, 3),
+        }
+
+
+class SessionStore:
+    def __init__(self, max_sessions: int = 64, ttl: float = 900.0):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: "OrderedDict[str, EngineSession]" = OrderedDict()  # least recently used first
+        self._lock = threading.Lock()
+        self.evicted = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self, now: float) -> None:
+        # Sessions are ordered by last use, so expired ones are at the front.
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used <= self.ttl:
+                break
+            self._sessions.popitem(last=False)
+            self.expired += 1
+
+    def create(self, initial_vector: Optional[Sequence[float]] = None, **engine_kwargs: Any) -> EngineSession:
+        """Build an ``Omega144Core(**engine_kwargs)`` and register it as a new session."""
+        core = Omega144Core(track_stats=False, **engine_kwargs)
+        if initial_vector is not None:
+            core.initialize(initial_vector)
+        session = EngineSession(core)
+        with self._lock:
+            self._expire(session.last_used)
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+            self._sessions[session.id] = session
+        return session
+
+    def get(self, session_id: str) -> Optional[EngineSession]:
+        """Look up a live session and mark it as used."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_used = now
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def touch(self, session: EngineSession) -> None:
+        """Mark ``session`` as used now, keeping the store ordered by last use."""
+        with self._lock:
+            session.last_used = time.monotonic()
+            if session.id in self._sessions:
+                self._sessions.move_to_end(session.id)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def list_sessions(self) -> List[EngineSession]:
+        with self._lock:
+            self._expire(time.monotonic())
+            return list(self._sessions.values())
+
+
+def advance_session(
+    session: EngineSession,
+    k: int,
+    inputs: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    fast_forward: bool = False,
+    include_state: bool = False,
+    stride: int = 1,
+) -> Dict[str, Any]:
+    """
+    Advance ``session`` by ``k`` steps, sampling coherence after every
+    ``stride``-th step. ``inputs[i]`` (if given) is routed into step ``i``;
+    steps past the end of ``inputs`` run without input. ``fast_forward``
+    takes the closed-form jump (input-free only), which logs a single event
+    instead of one per step and only evaluates coherence at the samples, so
+    a large ``stride`` keeps it cheap. The final state is only copied out
+    with ``include_state``.
+    """
+    inputs = inputs or []
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, got {stride}")
+    if len(inputs) > k:
+        raise ValueError(f"Got {len(inputs)} input vectors for {k} steps")
+    if fast_forward and inputs:
+        raise ValueError("fast_forward cannot route input vectors")
+
+    coherence = array("d")
+    with session.lock:
+        core = session.core
+        t0 = core.t + stride
+        if fast_forward:
+            out = core.fast_forward(k, coherence_stride=stride)
+            coherence.extend(out["metrics"]["coherence_samples"])
+        else:
+            step = core.step
+            n_inputs = len(inputs)
+            for i in range(k):
+                res = step(inputs[i] if i < n_inputs else None, detail="minimal")
+                if (i + 1) % stride == 0:
+                    coherence.append(res["coherence"])
+        state = [float(x) for x in core.state] if include_state else None
+        t = core.t
+    return {
+        "t0": t0,
+        "t": t,
+        "stride": stride,
+        "coherence": coherence,
+        "regime": classify_regimes(coherence),
+        "state": state,
+    }
+
+
+def encode_columns(columns: Dict[str, Any]) -> bytes:
+    """Pack ``advance_session`` output into the binary frame described above."""
+    coherence = array("d", columns["coherence"])
+    if sys.byteorder != "little":
+        coherence.byteswap()
+    return (
+        _FRAME_HEADER.pack(columns["t0"], len(coherence), columns["stride"])
+        + coherence.tobytes()
+        + array("b", columns["regime"]).tobytes()
+    )
@@ -0,0 +1,129 @@
+"""
+Streaming statistics for CanonForge Omega metrics.
+
+O(1)-memory accumulators for long runs: count, mean and variance (Welford),
+min/max, an exponentially weighted moving average and quantiles from a
+log-bucketed sketch (DDSketch-style, bounded relative error). Dashboards can
+read these instead of keeping the full event history.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Sequence
+
+
+class QuantileSketch:
+    """
+    Quantile sketch with relative accuracy ``rel_err``.
+
+    Values are counted in logarithmic buckets of ratio
+    ``gamma = (1 + rel_err) / (1 - rel_err)``; one dict increment per update.
+    At most ``max_buckets`` buckets per sign are kept by folding the
+    smallest-magnitude ones together, so memory stays bounded.
+    """
+
+    def __init__(self, rel_err: float = 0.01, max_buckets: int = 2048):
+        if not 0.0 < rel_err < 1.0:
+            raise ValueError(f"rel_err must be in (0, 1), got {rel_err}")
+        self.rel_err = rel_err
+        self.max_buckets = max_buckets
+        self._gamma = (1.0 + rel_err) / (1.0 - rel_err)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        self._pos: Dict[int, int] = {}
+        self._neg: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+
+    def update(self, x: float) -> None:
+        if not math.isfinite(x):  # has no bucket; MetricAccumulator counts these
+            return
+        self.count += 1
+        if x > 0.0:
+            buckets = self._pos
+        elif x < 0.0:
+            buckets = self._neg
+            x = -x
+        else:
+            self._zero += 1
+            return
+        key = math.ceil(math.log(x) * self._inv_log_gamma)
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            lowest, nxt = sorted(buckets)[:2]
+            buckets[nxt] += buckets.pop(lowest)
+
+    def _value(self, key: int) -> float:
+        return 2.0 * self._gamma**key / (self._gamma + 1.0)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._neg, reverse=True):
+            seen += self._neg[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._pos):
+            seen += self._pos[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._pos))
+
+
+class MetricAccumulator:
+    """Running summary of one scalar metric."""
+
+    def __init__(self, ewma_alpha: float = 0.05, quantiles: Sequence[float] = (0.5, 0.9, 0.99)):
+        self.ewma_alpha = float(ewma_alpha)
+        self.quantiles = tuple(quantiles)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma = math.nan
+        self.last = math.nan
+        self.nonfinite = 0  # NaN/inf samples seen (and skipped)
+        self.sketch = QuantileSketch()
+
+    def update(self, x: float) -> None:
+        if x is None:
+            return
+        if not math.isfinite(x):
+            self.nonfinite += 1
+            return
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        self.ewma = x if self.count == 1 else self.ewma + self.ewma_alpha * (x - self.ewma)
+        self.last = x
+        self.sketch.update(x)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        out = {
+            "count": self.count,
+            "last": self.last,
+            "mean": self.mean if self.count else math.nan,
+            "std": math.sqrt(self.variance),
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+            "ewma": self.ewma,
+            "nonfinite": self.nonfinite,
+        }
+        for q in self.quantiles:
+            out[f"p{q * 100:g}"] = self.sketch.quantile(q)
+        return out
@@ -4,7 +4,7 @@ SubverseCore · builds 188-style overlay: per-domain, per-axis, and globals.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 
 
 class SubverseCore:
@@ -12,19 +12,29 @@ class SubverseCore:
         self.n_domains = n_domains
         self.domain_size = domain_size
 
-    def expand(self, state: List[float], metrics: Dict) -> Dict:
-        domains = []
-        axes = []
+    def expand(
+        self,
+        state: List[float],
+        metrics: Dict,
+        row_means: Optional[Sequence[float]] = None,
+        col_means: Optional[Sequence[float]] = None,
+    ) -> Dict:
+        """
+        Build the overlay of ``state``. Pass the state's ``row_means`` /
+        ``col_means`` when they are already known (``DSSEngine.output_means``)
+        to skip rescanning it.
+        """
+        ds = self.domain_size
         # domains: rows
-        idx = 0
-        for _ in range(self.n_domains):
-            row_vals = state[idx : idx + self.domain_size]
-            idx += self.domain_size
-            domains.append(sum(row_vals) / max(len(row_vals), 1))
-        # axes: columns
-        for col in range(self.domain_size):
-            col_vals = [state[row * self.domain_size + col] for row in range(self.n_domains)]
-            axes.append(sum(col_vals) / max(len(col_vals), 1))
+        if row_means is None:
+            domains = [sum(state[i : i + ds]) / max(ds, 1) for i in range(0, self.n_domains * ds, ds)]
+        else:
+            domains = list(row_means)
+        # axes: columns (strided slices)
+        if col_means is None:
+            axes = [sum(state[col :: ds]) / max(self.n_domains, 1) for col in range(ds)]
+        else:
+            axes = list(col_means)
         overlay = {
             "domains": domains,
             "axes": axes,
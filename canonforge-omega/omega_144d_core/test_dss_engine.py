@@ -0,0 +1,82 @@
+"""
+Equivalence of the DSS backends, in particular the incremental bookkeeping
+of ``SparseDSSEngine`` (``GridState.merge`` / ``residual_ss``).
+
+Run with ``python -m pytest omega_144d_core``.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from omega_144d_core import Omega144Core, SparseInput  # noqa: E402
+
+N_DOMAINS, DOMAIN_SIZE = 12, 9
+STEPS = 600
+# Decaying gain (1 - damping + coupling < 1), so 600 steps stay finite.
+PARAMS = {"coupling": 0.18, "damping": 0.2}
+
+
+def _inputs(seed: int = 7):
+    """Per-step inputs: None, dense vectors (short and long) and sparse ones."""
+    rng = random.Random(seed)
+    dim = N_DOMAINS * DOMAIN_SIZE
+    out = []
+    for t in range(STEPS):
+        kind = t % 5
+        if kind == 1:
+            out.append([rng.uniform(-2, 2) for _ in range(rng.choice((dim // 2, dim, dim + 7)))])
+        elif kind in (2, 3):
+            idx = [rng.randrange(dim) for _ in range(rng.randint(1, 6))]  # repeats add up
+            out.append(SparseInput(idx, [rng.uniform(-5, 5) for _ in idx]))
+        else:
+            out.append(None)
+    return out
+
+
+def _core(backend: str) -> Omega144Core:
+    core = Omega144Core(N_DOMAINS, DOMAIN_SIZE, backend=backend, track_stats=False, **PARAMS)
+    rng = random.Random(1)
+    core.initialize([rng.uniform(-1, 1) for _ in range(N_DOMAINS * DOMAIN_SIZE)])
+    return core
+
+
+@pytest.mark.parametrize("resync_every", [1, 37, 10**9])
+def test_sparse_backend_matches_dense_backends(resync_every):
+    ref = _core("python")
+    arr = _core("numpy")
+    sparse = _core("sparse")
+    sparse.dss.resync_every = resync_every
+    sparse.state.resync_every = resync_every
+
+    for vec in _inputs():
+        expected = ref.step(vec, detail="metrics")
+        for core in (arr, sparse):
+            got = core.step(vec, detail="metrics")
+            for key in ("coherence", "variance", "max_abs", "mean"):
+                assert math.isclose(got["metrics"][key], expected["metrics"][key], rel_tol=1e-9, abs_tol=1e-12), (
+                    core.backend,
+                    expected["t"],
+                    key,
+                )
+        np.testing.assert_allclose(np.asarray(sparse.state), ref.state, rtol=1e-9, atol=1e-12)
+
+    # The carried statistics agree with a fresh rescan of the grid.
+    tracked = (sparse.state.row_means.copy(), sparse.state.col_means.copy(), sparse.state.residual_ss)
+    sparse.state.sync()
+    np.testing.assert_allclose(tracked[0], sparse.state.row_means, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(tracked[1], sparse.state.col_means, rtol=1e-9, atol=1e-12)
+    assert math.isclose(tracked[2], sparse.state.residual_ss, rel_tol=1e-7, abs_tol=1e-12)
+
+
+def test_sparse_input_out_of_range():
+    core = _core("sparse")
+    with pytest.raises(ValueError):
+        core.step(SparseInput([N_DOMAINS * DOMAIN_SIZE], [1.0]))
+    with pytest.raises(ValueError):
+        SparseInput([-1], [1.0]).dense(4)
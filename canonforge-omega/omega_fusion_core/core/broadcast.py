@@ -0,0 +1,146 @@
+"""
+Fan-out of items from any thread to asyncio subscribers.
+
+``Broadcaster.publish`` may be called from worker threads (e.g. the fusion
+ingest consumer). Each ``Subscription`` owns a bounded queue that lives on
+the subscriber's event loop; publishing appends under a lock and wakes the
+loop at most once per drain, so an idle subscriber costs nothing and a busy
+publisher does not flood the loop with callbacks. When a subscriber falls
+behind the ``policy`` decides:
+
+- ``"drop_oldest"``: evict the oldest queued item and count it in ``dropped``
+- ``"disconnect"``: close the subscription; its iterator ends
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "disconnect")
+
+
+class Subscription:
+    def __init__(self, broadcaster: "Broadcaster", loop: asyncio.AbstractEventLoop, max_queue: int):
+        self._broadcaster = broadcaster
+        self._loop = loop
+        self._items: Deque[Any] = deque()
+        self._max_queue = max_queue
+        self._wakeup = asyncio.Event()
+        self._signalled = False  # a wakeup is already scheduled on the loop
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, item: Any, policy: str) -> bool:
+        """Queue ``item`` (called with the broadcaster lock held); False if the subscriber must go."""
+        if len(self._items) >= self._max_queue:
+            if policy == "disconnect":
+                return False
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append(item)
+        return self._wake()
+
+    def _wake(self) -> bool:
+        if not self._signalled:
+            self._signalled = True
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:  # the subscriber's loop is gone
+                return False
+        return True
+
+    def _close(self) -> None:
+        self.closed = True
+        self._wake()
+
+    async def get_batch(self, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Wait for queued items and return all of them (oldest first). Returns
+        an empty list on timeout; raises ``StopAsyncIteration`` once closed
+        and drained.
+        """
+        while True:
+            with self._broadcaster._lock:
+                if self._items:
+                    items = list(self._items)
+                    self._items.clear()
+                    return items
+                if self.closed:
+                    raise StopAsyncIteration
+                self._signalled = False
+                self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+
+    def take_dropped(self) -> int:
+        """Number of items dropped since the last call."""
+        with self._broadcaster._lock:
+            n, self.dropped = self.dropped, 0
+        return n
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> List[Any]:
+        return await self.get_batch()
+
+
+class Broadcaster:
+    def __init__(self, max_queue: int = 256, policy: str = "drop_oldest"):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {SLOW_CONSUMER_POLICIES}")
+        self.max_queue = max_queue
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._counters: Dict[str, int] = {"published": 0, "dropped": 0, "disconnected": 0}
+
+    def subscribe(self) -> Subscription:
+        """Register a subscriber on the running event loop."""
+        sub = Subscription(self, asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+            sub._close()
+
+    def publish(self, item: Any) -> None:
+        """Deliver ``item`` to every subscriber; safe to call from any thread."""
+        with self._lock:
+            self._counters["published"] += 1
+            if not self._subscribers:
+                return
+            slow = []
+            for sub in self._subscribers:
+                dropped = sub.dropped
+                if not sub._offer(item, self.policy):
+                    slow.append(sub)
+                self._counters["dropped"] += sub.dropped - dropped
+            for sub in slow:
+                self._subscribers.remove(sub)
+                sub._close()
+                self._counters["disconnected"] += 1
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counters)
+            out["subscribers"] = len(self._subscribers)
+            out["max_queued"] = max((len(s._items) for s in self._subscribers), default=0)
+        out["policy"] = self.policy
+        return out
@@ -0,0 +1,62 @@
+"""
+Fixed-capacity, thread-safe event log with sequence numbers.
+
+Every appended event gets a monotonically increasing ``seq`` (starting at 1)
+and is stored in a preallocated ring, so appending and trimming are O(1).
+Readers pass the last ``seq`` they saw to ``read(since=...)`` and get only
+newer events; a cursor older than the retained window simply resumes at the
+oldest event still held.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class EventLog:
+    def __init__(self, capacity: int = 200):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._next_seq = 1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._next_seq - 1, self.capacity)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event (0 while empty)."""
+        return self._next_seq - 1
+
+    def append(self, event: Dict[str, Any]) -> int:
+        return self.extend([event])
+
+    def extend(self, events: List[Dict[str, Any]]) -> int:
+        """Append events in order (stamping each with ``seq``); return the last seq."""
+        with self._lock:
+            seq = self._next_seq
+            for event in events:
+                event["seq"] = seq
+                self._slots[(seq - 1) % self.capacity] = event
+                seq += 1
+            self._next_seq = seq
+            return seq - 1
+
+    def read(self, since: Optional[int] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Oldest-first events with ``seq > since``, at most ``limit`` of them.
+        Without ``since`` the latest ``limit`` events are returned.
+        """
+        with self._lock:
+            last = self._next_seq - 1
+            first = max(1, last - self.capacity + 1)
+            limit = max(0, min(limit, self.capacity))
+            if since is None:
+                start = max(first, last - limit + 1)
+            else:
+                start = max(first, since + 1)
+            stop = min(last, start + limit - 1)
+            return [self._slots[(seq - 1) % self.capacity] for seq in range(start, stop + 1)]
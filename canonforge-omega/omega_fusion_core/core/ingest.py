@@ -0,0 +1,187 @@
+"""
+Off-thread, batched ingest for fusion events.
+
+``IngestPipeline.submit`` only enqueues (it is a drop-in ``fusion_ingest_fn``
+for ``MacroPlayer``); a background consumer drains the bounded queue in
+micro-batches and hands each batch to ``process_batch``. When the queue is
+full the ``policy`` decides:
+
+- ``"block"``: wait for room (up to ``block_timeout``, then drop the item)
+- ``"drop_oldest"``: evict the oldest queued item
+- ``"sample"``: above half capacity admit only every ``sample_every``-th
+  item; drop new items when full
+
+``metrics()`` reports queue depth, drops and enqueue-to-processed latency.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .model import Channel, Domain, OmegaPacket, RoleKind, StateKind
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("block", "drop_oldest", "sample")
+
+
+def packet_from_event(event: Any) -> OmegaPacket:
+    """Map a PATTERN_STEP event dict to an OmegaPacket (packets pass through)."""
+    if isinstance(event, OmegaPacket):
+        return event
+    ts = event.get("timestamp")
+    if isinstance(ts, (int, float)):
+        ts = datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+    return OmegaPacket(
+        timestamp=ts,
+        domain=Domain.OS_APP,
+        state=StateKind.COGNITIVE,
+        role=RoleKind.DRIVER,
+        channel=Channel.OUTER,
+        tags=list(event.get("tags") or []),
+        payload=event,
+    )
+
+
+class IngestPipeline:
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], None],
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        max_wait: float = 0.05,
+        policy: str = "block",
+        sample_every: int = 10,
+        block_timeout: Optional[float] = None,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}")
+        self.process_batch = process_batch
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+        self.block_timeout = block_timeout
+
+        self._queue: Deque[Tuple[float, Any]] = deque()
+        self._cond = threading.Condition()
+        self._busy = 0  # items taken off the queue but not yet processed
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._pressure_seen = 0
+
+        self._counters: Dict[str, float] = {
+            "submitted": 0,
+            "accepted": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "processed": 0,
+            "batches": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+            "latency_sum_sec": 0.0,
+            "latency_max_sec": 0.0,
+        }
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._consume, name="fusion-ingest", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Process whatever is queued, then stop the consumer."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every accepted item is processed; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def submit(self, item: Any) -> bool:
+        """Enqueue ``item``; returns False if the backpressure policy dropped it."""
+        if self._thread is None:
+            self.start()
+        c = self._counters
+        with self._cond:
+            c["submitted"] += 1
+            queue = self._queue
+            if len(queue) >= self.max_queue // 2 and self.policy == "sample":
+                self._pressure_seen += 1
+                if self._pressure_seen % self.sample_every:
+                    c["sampled_out"] += 1
+                    return False
+            if len(queue) >= self.max_queue:
+                if self.policy == "drop_oldest":
+                    queue.popleft()
+                    c["dropped"] += 1
+                elif self.policy == "block":
+                    if not self._cond.wait_for(lambda: len(queue) < self.max_queue, self.block_timeout):
+                        c["dropped"] += 1
+                        return False
+                else:
+                    c["dropped"] += 1
+                    return False
+            queue.append((time.perf_counter(), item))
+            c["accepted"] += 1
+            if len(queue) > c["max_queue_depth"]:
+                c["max_queue_depth"] = len(queue)
+            if len(queue) >= self.batch_size:
+                self._cond.notify_all()
+            return True
+
+    __call__ = submit
+
+    def _consume(self) -> None:
+        c = self._counters
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._queue) >= self.batch_size or self._stopping, self.max_wait)
+                if not self._queue:
+                    if self._stopping:
+                        return
+                    continue
+                n = min(self.batch_size, len(self._queue))
+                taken = [self._queue.popleft() for _ in range(n)]
+                self._busy = n
+                self._cond.notify_all()  # wake blocked producers
+            try:
+                self._process([item for _, item in taken])
+            except Exception:
+                logger.exception("Fusion ingest batch of %d items failed", n)
+                c["errors"] += 1
+            done = time.perf_counter()
+            with self._cond:
+                self._busy = 0
+                c["processed"] += n
+                c["batches"] += 1
+                for enqueued, _ in taken:
+                    latency = done - enqueued
+                    c["latency_sum_sec"] += latency
+                    if latency > c["latency_max_sec"]:
+                        c["latency_max_sec"] = latency
+                self._cond.notify_all()
+
+    def _process(self, items: List[Any]) -> None:
+        # Separate method so instrumentation can time whole batches.
+        self.process_batch(items)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = dict(self._counters)
+            out["queue_depth"] = len(self._queue)
+        out["latency_avg_sec"] = out["latency_sum_sec"] / out["processed"] if out["processed"] else 0.0
+        out["policy"] = self.policy
+        return out
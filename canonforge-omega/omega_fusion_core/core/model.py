@@ -1,8 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List
-from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
 
 
 class Domain(str, Enum):
@@ -47,3 +50,46 @@ class OmegaPacket:
     channel: Channel
     tags: List[str] = field(default_factory=list)
     payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CompactPacket:
+    """
+    Slotted OmegaPacket for high-rate ingest: no per-instance ``__dict__``,
+    timestamp as integer microseconds since the Unix epoch (naive UTC,
+    ``None`` when absent) and tags as an immutable tuple.
+    """
+    timestamp_us: int | None
+    domain: Domain
+    state: StateKind
+    role: RoleKind
+    channel: Channel
+    tags: Tuple[str, ...] = ()
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_packet(cls, packet: OmegaPacket) -> "CompactPacket":
+        ts = packet.timestamp
+        if ts is not None and ts.tzinfo is not None:
+            raise ValueError("CompactPacket stores naive UTC timestamps; use PacketBatch for aware ones")
+        return cls(
+            timestamp_us=None if ts is None else (ts - EPOCH) // MICROSECOND,
+            domain=packet.domain,
+            state=packet.state,
+            role=packet.role,
+            channel=packet.channel,
+            tags=tuple(packet.tags),
+            payload=packet.payload,
+        )
+
+    def to_packet(self) -> OmegaPacket:
+        ts = None if self.timestamp_us is None else EPOCH + timedelta(microseconds=self.timestamp_us)
+        return OmegaPacket(
+            timestamp=ts,
+            domain=self.domain,
+            state=self.state,
+            role=self.role,
+            channel=self.channel,
+            tags=list(self.tags),
+            payload=self.payload,
+        )
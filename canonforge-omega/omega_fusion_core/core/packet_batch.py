@@ -0,0 +1,149 @@
+"""
+PacketBatch · columnar storage for many OmegaPackets.
+
+Parallel columns instead of one object per packet:
+
+- ``timestamps``: int64 microseconds since the Unix epoch (``NO_TIMESTAMP``
+  when absent; aware datetimes are stored as UTC and their tzinfo kept
+  aside)
+- ``domains`` / ``states`` / ``roles`` / ``channels``: int8 enum codes,
+  indices into ``DOMAINS`` / ``STATES`` / ``ROLES`` / ``CHANNELS``
+- ``tag_bits``: per-packet bitsets over the batch's interned tag table
+  (``tag_names``); uint64 while the batch has at most 64 distinct tags
+- ``payloads``: the payload dicts, by reference
+
+Conversion back to OmegaPacket is lossless: tag lists whose order or
+duplicates a bitset cannot express are kept verbatim on the side.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from .model import EPOCH, MICROSECOND, Channel, Domain, OmegaPacket, RoleKind, StateKind
+
+DOMAINS = tuple(Domain)
+STATES = tuple(StateKind)
+ROLES = tuple(RoleKind)
+CHANNELS = tuple(Channel)
+DOMAIN_CODES = {v: i for i, v in enumerate(DOMAINS)}
+STATE_CODES = {v: i for i, v in enumerate(STATES)}
+ROLE_CODES = {v: i for i, v in enumerate(ROLES)}
+CHANNEL_CODES = {v: i for i, v in enumerate(CHANNELS)}
+
+NO_TIMESTAMP = -(2**63)
+_EPOCH_UTC = EPOCH.replace(tzinfo=timezone.utc)
+
+
+class PacketBatch:
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.domains = array("b")
+        self.states = array("b")
+        self.roles = array("b")
+        self.channels = array("b")
+        self.tag_bits: Union[array, List[int]] = array("Q")
+        self.payloads: List[Dict[str, Any]] = []
+        self.tag_names: List[str] = []
+        self._tag_ids: Dict[str, int] = {}
+        self._tag_lists: Dict[int, List[str]] = {}  # rows whose tag list a bitset cannot reproduce
+        self._tzinfos: Dict[int, tzinfo] = {}  # rows with aware timestamps
+
+    @classmethod
+    def from_packets(cls, packets: Iterable[OmegaPacket]) -> "PacketBatch":
+        batch = cls()
+        batch.extend(packets)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def intern(self, tag: str) -> int:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_ids[tag] = len(self.tag_names)
+            self.tag_names.append(tag)
+            if tag_id == 64 and isinstance(self.tag_bits, array):
+                self.tag_bits = list(self.tag_bits)  # more than 64 tags: switch to Python ints
+        return tag_id
+
+    def tag_mask(self, *tags: str) -> int:
+        """Bitset of the given tags (tags unknown to this batch contribute nothing)."""
+        mask = 0
+        for tag in tags:
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is not None:
+                mask |= 1 << tag_id
+        return mask
+
+    def append(self, packet: OmegaPacket) -> None:
+        row = len(self.payloads)
+        ts = packet.timestamp
+        if ts is None:
+            self.timestamps.append(NO_TIMESTAMP)
+        elif ts.tzinfo is None:
+            self.timestamps.append((ts - EPOCH) // MICROSECOND)
+        else:
+            self.timestamps.append((ts - _EPOCH_UTC) // MICROSECOND)
+            self._tzinfos[row] = ts.tzinfo
+        self.domains.append(DOMAIN_CODES[packet.domain])
+        self.states.append(STATE_CODES[packet.state])
+        self.roles.append(ROLE_CODES[packet.role])
+        self.channels.append(CHANNEL_CODES[packet.channel])
+        bits = 0
+        for tag in packet.tags:
+            bits |= 1 << self.intern(tag)
+        self.tag_bits.append(bits)
+        if list(packet.tags) != self._tags_from_bits(bits):
+            self._tag_lists[row] = list(packet.tags)
+        self.payloads.append(packet.payload)
+
+    def extend(self, packets: Iterable[OmegaPacket]) -> None:
+        for packet in packets:
+            self.append(packet)
+
+    def _tags_from_bits(self, bits: int) -> List[str]:
+        names = self.tag_names
+        out = []
+        tag_id = 0
+        while bits:
+            if bits & 1:
+                out.append(names[tag_id])
+            bits >>= 1
+            tag_id += 1
+        return out
+
+    def tags(self, row: int) -> List[str]:
+        tags = self._tag_lists.get(row)
+        return list(tags) if tags is not None else self._tags_from_bits(self.tag_bits[row])
+
+    def timestamp(self, row: int) -> datetime | None:
+        us = self.timestamps[row]
+        if us == NO_TIMESTAMP:
+            return None
+        tz = self._tzinfos.get(row)
+        if tz is None:
+            return EPOCH + us * MICROSECOND
+        return (_EPOCH_UTC + us * MICROSECOND).astimezone(tz)
+
+    def __getitem__(self, row: int) -> OmegaPacket:
+        if row < 0:
+            row += len(self)
+        return OmegaPacket(
+            timestamp=self.timestamp(row),
+            domain=DOMAINS[self.domains[row]],
+            state=STATES[self.states[row]],
+            role=ROLES[self.roles[row]],
+            channel=CHANNELS[self.channels[row]],
+            tags=self.tags(row),
+            payload=self.payloads[row],
+        )
+
+    def __iter__(self) -> Iterator[OmegaPacket]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def to_packets(self) -> List[OmegaPacket]:
+        return list(self)
@@ -1,7 +1,15 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, NamedTuple, Tuple
 
-from .universal_moment import UniversalMomentSnapshot
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only from_arrays needs it
+    np = None
+
+from .packet_batch import PacketBatch
+from .universal_moment import UniversalMomentCalculator, UniversalMomentSnapshot
 
 
 @dataclass
@@ -11,11 +19,33 @@ class TICVector:
     integrity: float
     courage: float
 
-    @property
+    @cached_property
     def omega_effective(self) -> float:
         return round((self.truth + self.integrity + self.courage) / 3.0, 3)
 
 
+class TICArrays(NamedTuple):
+    """Column-wise TIC scores, one element per snapshot."""
+    truth: Any
+    integrity: Any
+    courage: Any
+    omega_effective: Any
+
+
+def _round3(x: Any) -> Any:
+    """
+    Elementwise ``round(x, 3)`` with Python's exact result. ``rint(x * 1000)``
+    only disagrees with correctly rounded ``round`` when ``x * 1000`` lies
+    within rounding error of a .5 tie; those elements take the scalar path.
+    """
+    scaled = x * 1000.0
+    out = np.rint(scaled) / 1000.0
+    suspect = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if suspect.any():
+        out[suspect] = [round(v, 3) for v in x[suspect].tolist()]
+    return out
+
+
 class TICCalculator:
     """Derives a TIC vector from a UniversalMomentSnapshot."""
 
@@ -28,3 +58,38 @@ class TICCalculator:
         courage = max(0.0, min(1.0, (avg - 0.5) * 2.0))
 
         return TICVector(truth=round(truth, 3), integrity=round(integrity, 3), courage=round(courage, 3))
+
+    def from_arrays(self, life: Any, system: Any) -> TICArrays:
+        """
+        Vectorized ``from_moment`` over arrays of life/system coherence.
+        Every element equals the scalar path bit for bit (requires numpy).
+        """
+        if np is None:
+            raise ImportError("TICCalculator.from_arrays requires numpy (pip install numpy)")
+        life = np.asarray(life, dtype=np.float64)
+        system = np.asarray(system, dtype=np.float64)
+        avg = (life + system) / 2.0
+        diff = np.abs(life - system)
+
+        truth = _round3(np.maximum(0.0, 1.0 - diff * 4.0))
+        integrity = _round3(np.maximum(0.0, np.minimum(1.0, np.minimum(life, system))))
+        courage = _round3(np.maximum(0.0, np.minimum(1.0, (avg - 0.5) * 2.0)))
+        omega = _round3((truth + integrity + courage) / 3.0)
+        return TICArrays(truth=truth, integrity=integrity, courage=courage, omega_effective=omega)
+
+    def from_moments(self, snaps: List[UniversalMomentSnapshot]) -> List[TICVector]:
+        """TIC vectors for many snapshots, evaluating each distinct coherence pair once."""
+        cache: Dict[Tuple[float, float], TICVector] = {}
+        out: List[TICVector] = []
+        for snap in snaps:
+            key = (snap.life_coherence, snap.system_coherence)
+            tic = cache.get(key)
+            if tic is None:
+                tic = cache[key] = self.from_moment(snap)
+            out.append(tic)
+        return out
+
+    def from_batch(self, batch: PacketBatch, calc: UniversalMomentCalculator | None = None) -> List[TICVector]:
+        """Per-packet TIC vectors for a PacketBatch (moments via ``calc.compute_each_batch``)."""
+        calc = calc or UniversalMomentCalculator(history_size=0)
+        return self.from_moments(calc.compute_each_batch(batch))
@@ -1,9 +1,13 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
-from typing import List
+from typing import Deque, Dict, Iterator, List, Tuple
 from datetime import datetime
 
-from .model import OmegaPacket
+from .model import OmegaPacket, StateKind
+from .packet_batch import STATE_CODES, PacketBatch
+
+WINDOW = 50  # packets that contribute to a moment
 
 
 @dataclass
@@ -14,24 +18,154 @@ class UniversalMomentSnapshot:
     system_coherence: float
 
 
+def _levels(step: float, n: int) -> Tuple[float, ...]:
+    # Built by repeated addition, exactly like the batch scan, so looking up
+    # a count gives bit-identical results to rescanning the window.
+    out = [0.85]
+    for _ in range(n):
+        out.append(out[-1] + step)
+    return tuple(max(0.0, min(1.0, x)) for x in out)
+
+
 class UniversalMomentCalculator:
-    """Simple placeholder for your Universal Measurement engine."""
+    """
+    Simple placeholder for your Universal Measurement engine.
 
-    def __init__(self) -> None:
-        self.history: List[UniversalMomentSnapshot] = []
+    ``compute_from_packets`` scores the last ``window`` packets of a list.
+    ``push`` maintains the same window incrementally (O(1) per packet) and
+    ``snapshot`` reads it; pushing a list packet by packet and calling
+    ``snapshot`` gives the same result as ``compute_from_packets(list)``.
+    Computed snapshots are kept in a bounded ``history`` ring, recording
+    every ``history_every``-th one.
+    """
 
-    def compute_from_packets(self, packets: List[OmegaPacket]) -> UniversalMomentSnapshot:
-        ts = packets[-1].timestamp if packets and packets[-1].timestamp else datetime.utcnow()
-        life = 0.85
-        system = 0.85
-        for p in packets[-50:]:
-            if "ecfr" in p.tags or "report" in p.tags:
-                system += 0.005
-            if p.state.name == "EMOTIONAL":
-                life += 0.002
-        life = max(0.0, min(1.0, life))
-        system = max(0.0, min(1.0, system))
+    def __init__(self, window: int = WINDOW, history_size: int = 1000, history_every: int = 1) -> None:
+        self.window = window
+        self.history: Deque[UniversalMomentSnapshot] = deque(maxlen=history_size)
+        self.history_every = max(1, history_every)
+        self._computed = 0
+        self._life_levels = _levels(0.002, window)
+        self._system_levels = _levels(0.005, window)
+        self._flags: Deque[Tuple[bool, bool]] = deque()
+        self._system_count = 0
+        self._life_count = 0
+        self._last_ts: datetime | None = None
+
+    @staticmethod
+    def _flags_of(p: OmegaPacket) -> Tuple[bool, bool]:
+        return ("ecfr" in p.tags or "report" in p.tags, p.state.name == "EMOTIONAL")
+
+    def _snap(self, ts: datetime | None, system_count: int, life_count: int) -> UniversalMomentSnapshot:
+        life = self._life_levels[life_count]
+        system = self._system_levels[system_count]
         uai = round((life + system) / 2.0, 3)
-        snap = UniversalMomentSnapshot(timestamp=ts, uai=uai, life_coherence=life, system_coherence=system)
-        self.history.append(snap)
+        return UniversalMomentSnapshot(
+            timestamp=ts or datetime.utcnow(), uai=uai, life_coherence=life, system_coherence=system
+        )
+
+    def _record(self, snap: UniversalMomentSnapshot) -> None:
+        if self._computed % self.history_every == 0:
+            self.history.append(snap)
+        self._computed += 1
+
+    def compute_from_packets(self, packets: List[OmegaPacket]) -> UniversalMomentSnapshot:
+        ts = packets[-1].timestamp if packets else None
+        system_count = life_count = 0
+        for p in packets[-self.window :]:
+            system_flag, life_flag = self._flags_of(p)
+            system_count += system_flag
+            life_count += life_flag
+        snap = self._snap(ts, system_count, life_count)
+        self._record(snap)
         return snap
+
+    @staticmethod
+    def _batch_flags(batch: PacketBatch, start: int = 0) -> Iterator[Tuple[bool, bool]]:
+        system_mask = batch.tag_mask("ecfr", "report")
+        emotional = STATE_CODES[StateKind.EMOTIONAL]
+        bits, states = batch.tag_bits, batch.states
+        for row in range(start, len(batch)):
+            yield (bits[row] & system_mask != 0, states[row] == emotional)
+
+    def push(self, packet: OmegaPacket) -> None:
+        """Slide the running window forward by one packet."""
+        self._push_flags(self._flags_of(packet), packet.timestamp)
+
+    def push_batch(self, batch: PacketBatch) -> None:
+        """``push`` every row of a PacketBatch, reading its columns directly."""
+        start = max(0, len(batch) - self.window)  # earlier rows would slide out anyway
+        for flags in self._batch_flags(batch, start):
+            self._push_flags(flags, None)
+        if len(batch):
+            self._last_ts = batch.timestamp(len(batch) - 1)
+
+    def _push_flags(self, flags: Tuple[bool, bool], ts: datetime | None) -> None:
+        self._flags.append(flags)
+        self._system_count += flags[0]
+        self._life_count += flags[1]
+        if len(self._flags) > self.window:
+            old_system, old_life = self._flags.popleft()
+            self._system_count -= old_system
+            self._life_count -= old_life
+        self._last_ts = ts
+
+    def snapshot(self, record: bool = False) -> UniversalMomentSnapshot:
+        """Moment of the running window; only added to ``history`` if ``record``."""
+        snap = self._snap(self._last_ts, self._system_count, self._life_count)
+        if record:
+            self._record(snap)
+        return snap
+
+    def compute_from_batch(self, batch: PacketBatch) -> UniversalMomentSnapshot:
+        """``compute_from_packets`` over a PacketBatch."""
+        n = len(batch)
+        system_count = life_count = 0
+        for system_flag, life_flag in self._batch_flags(batch, max(0, n - self.window)):
+            system_count += system_flag
+            life_count += life_flag
+        snap = self._snap(batch.timestamp(n - 1) if n else None, system_count, life_count)
+        self._record(snap)
+        return snap
+
+    def compute_each_batch(self, batch: PacketBatch) -> List[UniversalMomentSnapshot]:
+        """``compute_each`` over a PacketBatch."""
+        out: List[UniversalMomentSnapshot] = []
+        protos: Dict[Tuple[bool, bool], UniversalMomentSnapshot] = {}
+        now = None
+        for row, key in enumerate(self._batch_flags(batch)):
+            proto = protos.get(key)
+            if proto is None:
+                proto = protos[key] = self._snap(None, int(key[0]), int(key[1]))
+            ts = batch.timestamp(row)
+            if not ts:
+                ts = now = now or datetime.utcnow()
+            snap = UniversalMomentSnapshot(
+                timestamp=ts, uai=proto.uai, life_coherence=proto.life_coherence, system_coherence=proto.system_coherence
+            )
+            self._record(snap)
+            out.append(snap)
+        return out
+
+    def compute_each(self, packets: List[OmegaPacket]) -> List[UniversalMomentSnapshot]:
+        """
+        Bulk equivalent of calling ``compute_from_packets([p])`` for every
+        packet: the coherence levels only depend on a packet's (system tag,
+        emotional) signature, so each distinct signature is evaluated once.
+        """
+        levels: Dict[Tuple[bool, bool], UniversalMomentSnapshot] = {}
+        out: List[UniversalMomentSnapshot] = []
+        now = None
+        for p in packets:
+            key = self._flags_of(p)
+            proto = levels.get(key)
+            if proto is None:
+                proto = levels[key] = self._snap(None, int(key[0]), int(key[1]))
+            ts = p.timestamp
+            if not ts:
+                ts = now = now or datetime.utcnow()
+            snap = UniversalMomentSnapshot(
+                timestamp=ts, uai=proto.uai, life_coherence=proto.life_coherence, system_coherence=proto.system_coherence
+            )
+            self._record(snap)
+            out.append(snap)
+        return out
@@ -4,26 +4,33 @@ MacroExecutor · translates pattern steps into HostMuscles calls.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from .muscles import HostMuscles
 
+# step kind -> (HostMuscles method, payload key passed as its argument)
+DISPATCH: Dict[str, Tuple[str, str]] = {
+    "OPEN_APP": ("open_app", "name"),
+    "FOCUS": ("focus_window", "title"),
+    "TYPE": ("type_text", "text"),
+    "CLICK": ("click", "target"),
+}
+
 
 class MacroExecutor:
     def __init__(self, muscles: HostMuscles):
         self.muscles = muscles
 
-    def execute_step(self, step: Dict[str, Any], speed: float = 1.0):
+    def bind_step(self, step: Dict[str, Any]) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        """Resolve a step once into ``(bound HostMuscles method, args)``."""
         kind = step.get("kind") or step.get("type") or "LOG"
         payload = step.get("payload") or {}
+        entry = DISPATCH.get(kind)
+        if entry is None:
+            return self.muscles.custom_action, ({"kind": kind, "payload": payload},)
+        method, key = entry
+        return getattr(self.muscles, method), (payload.get(key, ""),)
 
-        if kind == "OPEN_APP":
-            self.muscles.open_app(payload.get("name", ""))
-        elif kind == "FOCUS":
-            self.muscles.focus_window(payload.get("title", ""))
-        elif kind == "TYPE":
-            self.muscles.type_text(payload.get("text", ""))
-        elif kind == "CLICK":
-            self.muscles.click(payload.get("target", ""))
-        else:
-            self.muscles.custom_action({"kind": kind, "payload": payload})
+    def execute_step(self, step: Dict[str, Any], speed: float = 1.0):
+        action, args = self.bind_step(step)
+        action(*args)
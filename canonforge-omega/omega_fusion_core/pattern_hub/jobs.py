@@ -0,0 +1,131 @@
+"""
+Pattern job scheduler for CanonForge Omega.
+
+Runs ``MacroPlayer.play_async`` as asyncio tasks tracked by job id. At most
+``max_concurrency`` macros play at once; further jobs wait as "pending".
+Jobs can be polled (``get``) or cancelled (``cancel``) at any time, and
+only the newest ``max_finished`` finished jobs are remembered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .macro_playback import MacroPlayer
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+@dataclass
+class PatternJob:
+    id: str
+    pattern_id: str | None
+    speed: float
+    loop_repeats: int
+    timing: str = "relative"
+    state: str = PENDING
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    timing_report: Dict[str, Any] | None = None  # PlaybackReport.summary() in deadline mode
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "pattern_id": self.pattern_id,
+            "state": self.state,
+            "speed": self.speed,
+            "loop_repeats": self.loop_repeats,
+            "timing": self.timing,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "timing_report": self.timing_report,
+        }
+
+
+class PatternJobScheduler:
+    def __init__(
+        self,
+        player_factory: Callable[[], MacroPlayer],
+        max_concurrency: int = 8,
+        max_finished: int = 1000,
+    ):
+        self.player_factory = player_factory
+        self.max_concurrency = max_concurrency
+        self.max_finished = max_finished
+        self._jobs: "OrderedDict[str, PatternJob]" = OrderedDict()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def submit(
+        self, sequence: Dict[str, Any], speed: float = 1.0, loop_repeats: int = 1, timing: str = "relative"
+    ) -> PatternJob:
+        """Schedule a macro run on the running event loop and return its job."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        job = PatternJob(
+            id=uuid.uuid4().hex,
+            pattern_id=sequence.get("id"),
+            speed=speed,
+            loop_repeats=loop_repeats,
+            timing=timing,
+        )
+        self._jobs[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job, sequence))
+        return job
+
+    async def _run(self, job: PatternJob, sequence: Dict[str, Any]) -> None:
+        try:
+            async with self._slots:
+                job.state = RUNNING
+                job.started_at = time.time()
+                report = await self.player_factory().play_async(
+                    sequence, speed=job.speed, loop_repeats=job.loop_repeats, timing=job.timing
+                )
+            if report is not None:
+                job.timing_report = report.summary()
+            job.state = DONE
+        except asyncio.CancelledError:
+            job.state = CANCELLED
+        except Exception as exc:
+            job.state = FAILED
+            job.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            job.finished_at = time.time()
+            job.task = None
+            self._prune()
+
+    def _prune(self) -> None:
+        finished = [jid for jid, j in self._jobs.items() if j.state in FINISHED_STATES]
+        for jid in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[jid]
+
+    def get(self, job_id: str) -> Optional[PatternJob]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[PatternJob]:
+        return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; False if the job is unknown or already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job.task is None or job.state in FINISHED_STATES:
+            return False
+        job.task.cancel()
+        return True
+
+    def active_count(self) -> int:
+        return sum(1 for j in self._jobs.values() if j.state in (PENDING, RUNNING))
@@ -4,15 +4,39 @@ Macro playback engine for CanonForge Omega.
 Iterates over pattern steps and:
 - logs each step into the fusion event stream via fusion_ingest_fn
 - delegates execution to a MacroExecutor backed by HostMuscles
+
+Sequences are compiled once into a ``MacroPlan`` (see ``plan.py``) and
+cached per pattern id/version, so replays only pay for the actions.
+``play`` blocks the calling thread for the whole macro; ``play_async`` is
+the asyncio-native variant (``asyncio.sleep`` between steps) for running
+many macros concurrently on one event loop.
+
+Timing modes:
+- ``"relative"`` (default): sleep ``delay / speed`` after each step, so
+  execution and ingest time add up as drift.
+- ``"deadline"``: every step starts at an absolute offset from the plan
+  start (see ``timing.py``); returns a ``PlaybackReport`` with per-step
+  lateness, a jitter histogram and the total drift.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from .plan import MacroPlan, PlanCache, PlanStep
+from .timing import PlaybackReport, clock, sleep_until
+
+TIMING_MODES = ("relative", "deadline")
 
 
 class MacroPlayer:
+    # Wraps each plan action while set (api.instrument sets it to time host
+    # actions); cached plans are never modified.
+    action_probe: Optional[Callable[[Callable[..., Any]], Callable[..., Any]]] = None
+
     def __init__(
         self,
         fusion_ingest_fn: Callable[[Dict[str, Any]], None],
@@ -20,30 +44,95 @@ class MacroPlayer:
     ):
         self.fusion_ingest_fn = fusion_ingest_fn
         self.executor = executor
+        self.plans = PlanCache(executor)
 
-    def play(self, sequence: Dict[str, Any], speed: float = 1.0, loop_repeats: int = 1):
-        if not sequence:
-            return
-        steps: List[Dict[str, Any]] = sequence.get("steps") or []
-        meta = {
-            "id": sequence.get("id"),
-            "name": sequence.get("name"),
-            "tags": sequence.get("tags") or [],
-        }
+    def compile(self, sequence: Union[Dict[str, Any], MacroPlan]) -> MacroPlan:
+        if isinstance(sequence, MacroPlan):
+            return sequence
+        return self.plans.get(sequence)
+
+    def _timed(self, plan: MacroPlan) -> MacroPlan:
+        """``plan`` with its actions wrapped by ``action_probe``, if one is set."""
+        probe = self.action_probe
+        if probe is None:
+            return plan
+        return dataclasses.replace(plan, steps=tuple(s._replace(action=probe(s.action)) for s in plan.steps))
+
+    def _schedule(
+        self, plan: MacroPlan, speed: float, loop_repeats: int, timing: str, report: Optional[PlaybackReport]
+    ) -> Iterator[Tuple[float, Optional[PlanStep], int]]:
+        """
+        Step schedule shared by ``play`` and ``play_async``. Yields
+        ``(due, step, loop_idx)``: the driver waits until clock time ``due``,
+        runs ``step`` with ``_fire`` and resumes the generator. The last item
+        has no step; it is the wait for the end of the run.
+        """
+        scale = 1.0 / max(speed, 0.01)
         loops = max(1, int(loop_repeats))
+        if timing == "deadline":
+            t0 = clock()
+            for loop_idx in range(loops):
+                base = t0 + loop_idx * plan.loop_duration * scale
+                for step in plan.steps:
+                    yield base + step.start * scale, step, loop_idx
+            end = t0 + loops * plan.loop_duration * scale
+            yield end, None, loops
+            report.total_drift = clock() - end
+            return
+        due = clock()
         for loop_idx in range(loops):
-            for idx, step in enumerate(steps):
-                event = {
-                    "type": "PATTERN_STEP",
-                    "pattern_id": meta["id"],
-                    "pattern_name": meta["name"],
-                    "loop_index": loop_idx,
-                    "step_index": idx,
-                    "step": step,
-                    "timestamp": time.time(),
-                }
-                self.fusion_ingest_fn(event)
-                self.executor.execute_step(step, speed=speed)
-                delay = float(step.get("delay", 0)) / max(speed, 0.01)
-                if delay > 0:
-                    time.sleep(delay)
+            for step in plan.steps:
+                yield due, step, loop_idx
+                due = clock() + step.delay * scale
+        yield due, None, loops
+
+    def _fire(self, step: PlanStep, loop_idx: int, due: float, report: Optional[PlaybackReport]) -> None:
+        if report is not None:
+            report.lateness.append(clock() - due)
+        self.fusion_ingest_fn({**step.event, "loop_index": loop_idx, "timestamp": time.time()})
+        step.action(*step.args)
+
+    def play(
+        self,
+        sequence: Union[Dict[str, Any], MacroPlan],
+        speed: float = 1.0,
+        loop_repeats: int = 1,
+        timing: str = "relative",
+        spin: float = 0.002,
+    ) -> Optional[PlaybackReport]:
+        if timing not in TIMING_MODES:
+            raise ValueError(f"Unknown timing {timing!r}; expected one of {TIMING_MODES}")
+        if not sequence:
+            return None
+        plan = self._timed(self.compile(sequence))
+        report = PlaybackReport() if timing == "deadline" else None
+        spin = spin if report is not None else 0.0  # relative mode only sleeps
+        for due, step, loop_idx in self._schedule(plan, speed, loop_repeats, timing, report):
+            sleep_until(due, spin)
+            if step is not None:
+                self._fire(step, loop_idx, due, report)
+        return report
+
+    async def play_async(
+        self,
+        sequence: Union[Dict[str, Any], MacroPlan],
+        speed: float = 1.0,
+        loop_repeats: int = 1,
+        timing: str = "relative",
+    ) -> Optional[PlaybackReport]:
+        """
+        Same as ``play`` but yields to the event loop between steps and is
+        cancellable. Deadline mode never spins here (that would block the
+        loop), so lateness is bounded by the event loop's timer resolution.
+        """
+        if timing not in TIMING_MODES:
+            raise ValueError(f"Unknown timing {timing!r}; expected one of {TIMING_MODES}")
+        if not sequence:
+            return None
+        plan = self._timed(self.compile(sequence))
+        report = PlaybackReport() if timing == "deadline" else None
+        for due, step, loop_idx in self._schedule(plan, speed, loop_repeats, timing, report):
+            await asyncio.sleep(max(0.0, due - clock()))
+            if step is not None:
+                self._fire(step, loop_idx, due, report)
+        return report
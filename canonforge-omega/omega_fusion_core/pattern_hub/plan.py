@@ -0,0 +1,111 @@
+"""
+Compiled macro plans for CanonForge Omega.
+
+``compile_sequence`` turns a pattern into an immutable ``MacroPlan`` once:
+every step is pre-bound to its HostMuscles method and arguments, delays are
+parsed to floats with their cumulative start offsets precomputed, and the
+constant part of each PATTERN_STEP event is prebuilt. Replaying a plan only
+runs the actions.
+
+``PlanCache`` keeps compiled plans per pattern id and version (the store's
+``version`` field, or a content fingerprint when there is none).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class PlanStep(NamedTuple):
+    action: Callable[..., Any]
+    args: Tuple[Any, ...]
+    delay: float  # seconds after this step, at speed 1.0
+    start: float  # offset of this step from the start of its loop, at speed 1.0
+    event: Dict[str, Any]  # constant PATTERN_STEP fields; do not mutate
+
+
+@dataclass(frozen=True)
+class MacroPlan:
+    pattern_id: Optional[str]
+    pattern_name: Optional[str]
+    tags: Tuple[str, ...]
+    version: Optional[str]
+    steps: Tuple[PlanStep, ...]
+    loop_duration: float  # sum of all step delays, at speed 1.0
+
+
+def sequence_version(sequence: Dict[str, Any]) -> str:
+    """Explicit ``version`` if the store provides one, else a hash of the content."""
+    version = sequence.get("version")
+    if version is not None:
+        return str(version)
+    blob = json.dumps(sequence, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=12).hexdigest()
+
+
+def compile_sequence(sequence: Dict[str, Any], executor: "MacroExecutor", version: Optional[str] = None) -> MacroPlan:
+    pattern_id = sequence.get("id")
+    pattern_name = sequence.get("name")
+    tags = tuple(sequence.get("tags") or ())
+    steps = []
+    offset = 0.0
+    for idx, step in enumerate(sequence.get("steps") or []):
+        action, args = executor.bind_step(step)
+        delay = max(0.0, float(step.get("delay", 0)))
+        event = {
+            "type": "PATTERN_STEP",
+            "pattern_id": pattern_id,
+            "pattern_name": pattern_name,
+            "tags": tags,
+            "step_index": idx,
+            "step": step,
+        }
+        steps.append(PlanStep(action=action, args=args, delay=delay, start=offset, event=event))
+        offset += delay
+    return MacroPlan(
+        pattern_id=pattern_id,
+        pattern_name=pattern_name,
+        tags=tags,
+        version=version,
+        steps=tuple(steps),
+        loop_duration=offset,
+    )
+
+
+class PlanCache:
+    """LRU of compiled plans for one executor, keyed by pattern id and version."""
+
+    def __init__(self, executor: "MacroExecutor", maxsize: int = 256):
+        self.executor = executor
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        # pattern id -> (version, plan)
+        self._plans: "OrderedDict[str, Tuple[str, MacroPlan]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sequence: Dict[str, Any]) -> MacroPlan:
+        # Always keyed on the version, so a dict edited in place recompiles.
+        seq_id = sequence.get("id")
+        if seq_id is None:
+            return compile_sequence(sequence, self.executor)
+        version = sequence_version(sequence)
+        with self._lock:
+            entry = self._plans.get(seq_id)
+            if entry is not None and entry[0] == version:
+                self._plans.move_to_end(seq_id)
+                self.hits += 1
+                return entry[1]
+        plan = compile_sequence(sequence, self.executor, version=version)
+        with self._lock:
+            self.misses += 1
+            self._plans[seq_id] = (version, plan)
+            self._plans.move_to_end(seq_id)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
@@ -0,0 +1,68 @@
+"""
+Deadline timing for macro playback.
+
+In deadline mode every step gets an absolute start time on the monotonic
+clock, computed from the plan start and the precomputed step offsets, so
+execution and ingest time never accumulate into drift. ``sleep_until``
+sleeps for the bulk of the wait and busy-spins the last ``spin`` seconds to
+beat sleep granularity. ``PlaybackReport`` collects how late each step
+started.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Sequence
+
+clock = time.perf_counter
+
+# Upper bounds (seconds) of the lateness histogram buckets; the last bucket is open.
+JITTER_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)
+
+
+def sleep_until(deadline: float, spin: float = 0.002) -> None:
+    remaining = deadline - clock()
+    if remaining > spin:
+        time.sleep(remaining - spin)
+    while clock() < deadline:
+        pass
+
+
+@dataclass
+class PlaybackReport:
+    # per-step start lateness in seconds (actual - scheduled), in play order
+    lateness: array = field(default_factory=lambda: array("d"))
+    # actual end minus scheduled end of the whole run, in seconds
+    total_drift: float = 0.0
+
+    @property
+    def steps(self) -> int:
+        return len(self.lateness)
+
+    def jitter_histogram(self, buckets: Sequence[float] = JITTER_BUCKETS) -> Dict[str, int]:
+        counts = [0] * (len(buckets) + 1)
+        for late in self.lateness:
+            counts[bisect_left(buckets, abs(late))] += 1
+        labels = [f"<={b * 1000:g}ms" for b in buckets] + [f">{buckets[-1] * 1000:g}ms"]
+        return dict(zip(labels, counts))
+
+    def summary(self) -> Dict[str, object]:
+        ordered = sorted(self.lateness)
+        n = len(ordered)
+
+        def pct(q: float) -> float:
+            return ordered[min(n - 1, int(q * n))] if n else math.nan
+
+        return {
+            "steps": n,
+            "mean_lateness": sum(ordered) / n if n else math.nan,
+            "p50_lateness": pct(0.50),
+            "p99_lateness": pct(0.99),
+            "max_lateness": ordered[-1] if n else math.nan,
+            "total_drift": self.total_drift,
+            "jitter_histogram": self.jitter_histogram(),
+        }
@@ -3,6 +3,8 @@ SequenceStore · JSON-backed pattern storage for CanonForge Omega.
 
 Default file: ~/.omega_fusion/sequences.json
 
+For large libraries with writes, see ``sqlite_store.SqliteSequenceStore``.
+
 Structure:
 
 {
@@ -16,12 +18,15 @@ Structure:
 from __future__ import annotations
 
 import json
+import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_STORE_PATH = Path(os.path.expanduser("~/.omega_fusion/sequences.json"))
 
 
@@ -49,11 +54,16 @@ class SequenceStore:
             with self.path.open("r", encoding="utf-8") as f:
                 raw = json.load(f)
         except Exception:
+            logger.exception("Could not read pattern store %s; serving no patterns", self.path)
             raw = {}
         patterns = raw.get("patterns", [])
         self._cache = {p.get("id"): p for p in patterns if "id" in p}
         self._loaded = True
 
+    def list_ids(self) -> List[str]:
+        self._load()
+        return sorted(self._cache)
+
     def list_sequences(self) -> List[SequenceMeta]:
         self._load()
         out: List[SequenceMeta] = []
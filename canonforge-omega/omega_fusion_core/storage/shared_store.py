@@ -0,0 +1,163 @@
+"""
+SharedSequenceStore · process-wide, in-memory view of the JSON pattern file.
+
+Lookups are served from an immutable snapshot dict, so reads need no lock.
+At most once per ``check_interval`` seconds a read stats the file; when its
+mtime or size changed, the file is re-read and hashed, and only a changed
+hash triggers a re-parse. Re-parsing happens on a background thread (the
+old snapshot keeps serving until the new one is swapped in), and a file
+that fails to parse leaves the previous snapshot in place.
+
+JSON cannot be parsed piecewise, so a changed file is parsed in full; use
+``SqliteSequenceStore`` when per-record reads matter more than cache hits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sequence_store import DEFAULT_STORE_PATH, SequenceMeta
+
+logger = logging.getLogger(__name__)
+
+
+class SharedSequenceStore:
+    def __init__(self, path: Path | None = None, check_interval: float = 1.0, background: bool = True):
+        self.path = Path(path or DEFAULT_STORE_PATH)
+        self.check_interval = float(check_interval)
+        self.background = background
+
+        self._patterns: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+        self._digest: Optional[bytes] = None
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._reloader_lock = threading.Lock()
+        self._reloader: Optional[threading.Thread] = None
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "checks": 0,
+            "reloads": 0,
+            "unchanged_reloads": 0,
+            "parse_errors": 0,
+            "last_parse_sec": 0.0,
+            "total_parse_sec": 0.0,
+        }
+        self._reload(self._stat())
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _reload(self, signature: Optional[Tuple[int, int]]) -> None:
+        with self._reload_lock:
+            if signature == self._signature:
+                return
+            if signature is None:
+                self._patterns, self._signature, self._digest = {}, None, None
+                self._count("reloads")
+                return
+            try:
+                data = self.path.read_bytes()
+            except OSError:
+                logger.exception("Could not read pattern store %s", self.path)
+                return
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._digest:
+                self._signature = signature
+                self._count("unchanged_reloads")
+                return
+            started = time.perf_counter()
+            try:
+                raw = json.loads(data)
+                patterns = {p["id"]: p for p in raw.get("patterns", []) if "id" in p}
+            except Exception:
+                # Remember the bad version so it is not re-parsed until the file changes again.
+                self._signature, self._digest = signature, digest
+                self._count("parse_errors")
+                logger.exception("Could not parse pattern store %s; keeping previous patterns", self.path)
+                return
+            elapsed = time.perf_counter() - started
+            self._patterns = patterns
+            self._signature, self._digest = signature, digest
+            with self._stats_lock:
+                self._stats["reloads"] += 1
+                self._stats["last_parse_sec"] = elapsed
+                self._stats["total_parse_sec"] += elapsed
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        self._count("checks")
+        signature = self._stat()
+        if signature == self._signature:
+            return
+        if not self.background:
+            self._reload(signature)
+            return
+        with self._reloader_lock:
+            if self._reloader is not None and self._reloader.is_alive():
+                return
+            self._reloader = threading.Thread(
+                target=self._reload, args=(signature,), name="sequence-store-reload", daemon=True
+            )
+            self._reloader.start()
+
+    def refresh(self) -> None:
+        """Synchronously pick up any change to the file, ignoring ``check_interval``."""
+        self._reload(self._stat())
+
+    def list_ids(self) -> List[str]:
+        self._maybe_reload()
+        return sorted(self._patterns)
+
+    def list_sequences(self) -> List[SequenceMeta]:
+        self._maybe_reload()
+        return [
+            SequenceMeta(id=sid, name=p.get("name"), tags=p.get("tags") or [])
+            for sid, p in sorted(self._patterns.items())
+        ]
+
+    def get_sequence(self, seq_id: str) -> Optional[Dict[str, Any]]:
+        self._maybe_reload()
+        pattern = self._patterns.get(seq_id)
+        self._count("hits" if pattern is not None else "misses")
+        return pattern
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["patterns"] = len(self._patterns)
+        return out
+
+
+_shared: Dict[Path, SharedSequenceStore] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_store(path: Path | None = None) -> SharedSequenceStore:
+    """Process-wide SharedSequenceStore for ``path`` (created on first use)."""
+    key = Path(path or DEFAULT_STORE_PATH)
+    with _shared_lock:
+        store = _shared.get(key)
+        if store is None:
+            store = _shared[key] = SharedSequenceStore(key)
+        return store
@@ -0,0 +1,164 @@
+"""
+SqliteSequenceStore · indexed pattern storage for CanonForge Omega.
+
+Default file: ~/.omega_fusion/sequences.db
+
+Each pattern is one row (JSON body plus indexed id/name columns, with tags in
+a separate indexed table), so ``get_sequence`` reads a single record and
+listings never touch pattern bodies. Writes run in SQLite transactions and
+are atomic. Returned patterns carry a ``version`` that increases on every
+``put_sequence``.
+
+Import an existing JSON store once with ``migrate_from_json()``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .sequence_store import DEFAULT_STORE_PATH, SequenceMeta
+
+DEFAULT_DB_PATH = Path(os.path.expanduser("~/.omega_fusion/sequences.db"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS patterns (
+    id      TEXT PRIMARY KEY,
+    name    TEXT,
+    version INTEGER NOT NULL,
+    body    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS patterns_name ON patterns(name);
+CREATE TABLE IF NOT EXISTS pattern_tags (
+    tag TEXT NOT NULL,
+    id  TEXT NOT NULL REFERENCES patterns(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, id)
+);
+CREATE INDEX IF NOT EXISTS pattern_tags_id ON pattern_tags(id);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SqliteSequenceStore:
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path or DEFAULT_DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _metas(self, where: str = "", params: tuple = ()) -> List[SequenceMeta]:
+        rows = self._query(f"SELECT id, name FROM patterns {where} ORDER BY id", params)
+        tags: Dict[str, List[str]] = {sid: [] for sid, _ in rows}
+        for tag, sid in self._query(
+            f"SELECT tag, id FROM pattern_tags WHERE id IN (SELECT id FROM patterns {where}) ORDER BY rowid",
+            params,
+        ):
+            tags[sid].append(tag)
+        return [SequenceMeta(id=sid, name=name, tags=tags[sid]) for sid, name in rows]
+
+    def list_ids(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT id FROM patterns ORDER BY id")]
+
+    def list_sequences(self) -> List[SequenceMeta]:
+        return self._metas()
+
+    def find_by_name(self, name: str) -> List[SequenceMeta]:
+        return self._metas("WHERE name = ?", (name,))
+
+    def find_by_tag(self, tag: str) -> List[SequenceMeta]:
+        return self._metas("WHERE id IN (SELECT id FROM pattern_tags WHERE tag = ?)", (tag,))
+
+    def get_sequence(self, seq_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT version, body FROM patterns WHERE id = ?", (seq_id,))
+        if not rows:
+            return None
+        version, body = rows[0]
+        pattern = json.loads(body)
+        pattern["version"] = version
+        return pattern
+
+    def _put(self, pattern: Dict[str, Any]) -> int:
+        seq_id = pattern.get("id")
+        if not seq_id:
+            raise ValueError("Pattern must have an 'id'")
+        body = {k: v for k, v in pattern.items() if k != "version"}
+        row = self._conn.execute("SELECT version FROM patterns WHERE id = ?", (seq_id,)).fetchone()
+        version = (row[0] if row else 0) + 1
+        self._conn.execute(
+            "INSERT OR REPLACE INTO patterns (id, name, version, body) VALUES (?, ?, ?, ?)",
+            (seq_id, pattern.get("name"), version, json.dumps(body, separators=(",", ":"))),
+        )
+        self._conn.execute("DELETE FROM pattern_tags WHERE id = ?", (seq_id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO pattern_tags (tag, id) VALUES (?, ?)",
+            [(tag, seq_id) for tag in pattern.get("tags") or []],
+        )
+        return version
+
+    def put_sequence(self, pattern: Dict[str, Any]) -> int:
+        """Insert or replace a pattern atomically; returns its new version."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = self._put(pattern)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return version
+
+    def delete_sequence(self, seq_id: str) -> bool:
+        """Delete a pattern atomically; returns False if it did not exist."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM patterns WHERE id = ?", (seq_id,))
+            return cur.rowcount > 0
+
+    def migrate_from_json(self, json_path: Path | None = None, force: bool = False) -> int:
+        """
+        Import every pattern of a JSON store in one transaction and return
+        how many were imported. Runs once per source file unless ``force``;
+        a file that cannot be parsed raises instead of importing nothing.
+        """
+        json_path = Path(json_path or DEFAULT_STORE_PATH)
+        key = f"migrated:{json_path.resolve()}"
+        if not force and self._query("SELECT 1 FROM store_meta WHERE key = ?", (key,)):
+            return 0
+        if not json_path.exists():
+            return 0
+        with json_path.open("r", encoding="utf-8") as f:
+            try:
+                raw = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Cannot migrate {json_path}: {exc}") from exc
+        patterns = [p for p in raw.get("patterns", []) if "id" in p]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for p in patterns:
+                    self._put(p)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, str(len(patterns)))
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(patterns)